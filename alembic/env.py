@@ -1,15 +1,12 @@
 import asyncio
 import os
-import sys
 from logging.config import fileConfig
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
-# Add the backend app directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
+# The repo root is put on sys.path by `prepend_sys_path = .` in alembic.ini
 from app.core.database import Base
 from app.models import *  # Import all models
 
@@ -25,11 +25,11 @@ async def smoothen_email(
     db: AsyncSession = Depends(get_db),
     http_request: Request = None,
 ):
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         result = await email_smoothener_service.smoothen_email(request.raw_text)
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
         await email_smoothener_db_service.save_session(
             db=db,
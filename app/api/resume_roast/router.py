@@ -49,7 +49,7 @@ async def roast_resume_text(
     Returns:
         ResumeRoastResponse: Roasting results with feedback and suggestions
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Validate input
@@ -72,7 +72,7 @@ async def roast_resume_text(
         )
         
         # Calculate processing time
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
         
         # Save session to database
         await ResumeRoastDatabaseService.save_roast_session(
@@ -159,7 +159,7 @@ async def upload_and_roast_resume(
     Returns:
         ResumeRoastResponse: Roasting results with feedback and suggestions
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Process the uploaded file
@@ -180,7 +180,7 @@ async def upload_and_roast_resume(
         )
         
         # Calculate processing time
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
         
         # Save session to database
         await ResumeRoastDatabaseService.save_roast_session(
@@ -32,7 +32,7 @@ from app.schemas.skill_assessment import (
     QuizOption,
     ExperienceLevel
 )
-from app.services.skill_assessment_ai_service import SkillAssessmentAIService
+from app.services.skill_assessment_ai_service import skill_assessment_ai_service
 from app.services.database.resume_roast_service import ResumeRoastDatabaseService
 
 import logging
@@ -40,8 +40,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/skill-assessment", tags=["Skill Assessment"])
 
-# Initialize AI service
-ai_service = SkillAssessmentAIService()
+# Shared AI service singleton
+ai_service = skill_assessment_ai_service
+
+# LearningPlanResponse fields stored as the plan_content JSON; dumped in one pass
+_PLAN_CONTENT_FIELDS = {
+    "learning_modules", "project_ideas", "market_trends",
+    "learning_resources", "career_progression", "market_research_insights"
+}
 
 @router.post("/start", response_model=AssessmentStartResponse)
 async def start_assessment(
@@ -87,15 +93,13 @@ async def start_assessment(
                 difficulty_level=q.difficulty_level.value,
                 question_order=i + 1
             )
-            db.add(db_question)
             db_questions.append(db_question)
         
+        # One batched INSERT ... RETURNING populates every question ID; with
+        # expire_on_commit=False they stay loaded, so no per-row refresh is needed
+        db.add_all(db_questions)
         await db.commit()
         
-        # Refresh to get IDs
-        for db_q in db_questions:
-            await db.refresh(db_q)
-        
         # Update response with actual database IDs
         questions_response = []
         for db_q, ai_q in zip(db_questions, ai_questions):
@@ -295,33 +299,7 @@ async def stream_learning_plan_generation(
             async def send_progress(update: dict):
                 await progress_queue.put(update)
             
-            # Send skill gaps progress
-            await progress_queue.put({
-                "stage": "skill_gaps",
-                "message": "📊 Analyzing your skill gaps and prioritizing learning areas...",
-                "progress": 25
-            })
-            
-            # Small delay to show progress
-            await asyncio.sleep(0.5)
-            
-            # Send objectives progress
-            await progress_queue.put({
-                "stage": "objectives",
-                "message": "🎯 Defining personalized learning objectives...",
-                "progress": 40
-            })
-            
-            await asyncio.sleep(0.5)
-            
-            # Send curriculum progress
-            await progress_queue.put({
-                "stage": "curriculum",
-                "message": "📚 Designing comprehensive curriculum with weekly breakdowns...",
-                "progress": 55
-            })
-            
-            # Generate learning plan with progress tracking
+            # The agent reports every stage (skill gaps through assembly) through the callback
             learning_plan = await ai_service.generate_learning_plan(
                 topic=assessment.topic,
                 evaluation=evaluation,
@@ -329,31 +307,6 @@ async def stream_learning_plan_generation(
                 progress_callback=send_progress
             )
             
-            # Send resources progress
-            await progress_queue.put({
-                "stage": "resources",
-                "message": "📌 Curating best learning resources (courses, tutorials, videos)...",
-                "progress": 70
-            })
-            
-            await asyncio.sleep(0.5)
-            
-            # Send projects progress
-            await progress_queue.put({
-                "stage": "projects",
-                "message": "🛠️ Creating hands-on project ideas for your portfolio...",
-                "progress": 85
-            })
-            
-            await asyncio.sleep(0.5)
-            
-            # Send assembly progress
-            await progress_queue.put({
-                "stage": "assembly",
-                "message": "✨ Finalizing your personalized learning roadmap...",
-                "progress": 95
-            })
-            
             # Delete existing learning plan if exists
             existing_plan = await db.execute(
                 select(LearningPlan).filter(LearningPlan.assessment_id == assessment.id)
@@ -364,14 +317,7 @@ async def stream_learning_plan_generation(
                 await db.commit()
             
             # Save learning plan to database
-            plan_content = {
-                "learning_modules": [mod.dict() for mod in learning_plan.learning_modules],
-                "project_ideas": [proj.dict() for proj in learning_plan.project_ideas],
-                "market_trends": [trend.dict() for trend in learning_plan.market_trends],
-                "learning_resources": [res.dict() for res in learning_plan.learning_resources] if hasattr(learning_plan, 'learning_resources') else [],
-                "career_progression": learning_plan.career_progression if hasattr(learning_plan, 'career_progression') else None,
-                "market_research_insights": learning_plan.market_research_insights if hasattr(learning_plan, 'market_research_insights') else None
-            }
+            plan_content = learning_plan.model_dump(include=_PLAN_CONTENT_FIELDS)
             
             db_learning_plan = LearningPlan(
                 assessment_id=assessment.id,
@@ -490,14 +436,7 @@ async def generate_learning_plan(
         
         # Save learning plan to database
         # Store the complete plan in plan_content for retrieval
-        plan_content = {
-            "learning_modules": [mod.dict() for mod in learning_plan.learning_modules],
-            "project_ideas": [proj.dict() for proj in learning_plan.project_ideas],
-            "market_trends": [trend.dict() for trend in learning_plan.market_trends],
-            "learning_resources": [res.dict() for res in learning_plan.learning_resources] if hasattr(learning_plan, 'learning_resources') else [],
-            "career_progression": learning_plan.career_progression if hasattr(learning_plan, 'career_progression') else None,
-            "market_research_insights": learning_plan.market_research_insights if hasattr(learning_plan, 'market_research_insights') else None
-        }
+        plan_content = learning_plan.model_dump(include=_PLAN_CONTENT_FIELDS)
         
         db_learning_plan = LearningPlan(
             assessment_id=assessment.id,
@@ -622,7 +561,7 @@ async def export_learning_plan_pdf(
     4. Return PDF file
     """
     try:
-        from app.services.pdf_service import PDFService
+        from app.services.pdf_service import pdf_service
         from fastapi.responses import Response
         
         user_id = current_user.id
@@ -693,7 +632,6 @@ async def export_learning_plan_pdf(
         logger.info(f"PDF export data prepared: topic={assessment.topic}, modules={len(plan_data.get('learning_modules', []))}, strengths={len(strengths)}, priority_skills={len(priority_skills)}")
         
         # Generate PDF
-        pdf_service = PDFService()
         pdf_data = pdf_service.generate_learning_plan_pdf(assessment_data)
         
         # Update export count
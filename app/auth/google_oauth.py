@@ -17,6 +17,14 @@ class GoogleOAuthHandler:
         self.client_secret = settings.GOOGLE_CLIENT_SECRET
         self.redirect_uri = settings.google_oauth_redirect_uri
         
+        # Shared keep-alive client so token exchange and userinfo calls reuse warm
+        # TLS connections across logins; transport retries cover connect failures only
+        self._http_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=3),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=4)
+        )
+        
         # Register Google OAuth client
         self.google = self.oauth.register(
             name='google',
@@ -28,6 +36,10 @@ class GoogleOAuthHandler:
             }
         )
     
+    async def close(self):
+        """Close the shared HTTP connection pool"""
+        await self._http_client.aclose()
+    
     def get_authorization_url(self, state: Optional[str] = None) -> str:
         """
         Generate Google OAuth authorization URL
@@ -74,14 +86,13 @@ class GoogleOAuthHandler:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    settings.GOOGLE_OAUTH_TOKEN_URL,
-                    data=token_data,
-                    headers={'Accept': 'application/json'}
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._http_client.post(
+                settings.GOOGLE_OAUTH_TOKEN_URL,
+                data=token_data,
+                headers={'Accept': 'application/json'}
+            )
+            response.raise_for_status()
+            return response.json()
                 
         except httpx.HTTPError as e:
             raise HTTPException(
@@ -103,13 +114,12 @@ class GoogleOAuthHandler:
             HTTPException: If user info retrieval fails
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    settings.GOOGLE_OAUTH_USERINFO_URL,
-                    headers={'Authorization': f'Bearer {access_token}'}
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._http_client.get(
+                settings.GOOGLE_OAUTH_USERINFO_URL,
+                headers={'Authorization': f'Bearer {access_token}'}
+            )
+            response.raise_for_status()
+            return response.json()
                 
         except httpx.HTTPError as e:
             raise HTTPException(
@@ -144,9 +154,6 @@ class GoogleOAuthHandler:
         # Get user information
         user_info = await self.get_user_info(access_token)
         
-        # Debug: Print raw user info from Google
-        print(f"🔍 Raw Google userinfo API response: {user_info}")
-        
         return {
             'email': user_info.get('email'),
             'name': user_info.get('name'),
@@ -1,59 +1,96 @@
 """
 Debug script to check database connection and schema from Container App perspective
 """
+import gc
+import tracemalloc
+from itertools import groupby
+from operator import itemgetter
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 from app.core.database import engine
 from sqlalchemy import text
 
 debug_router = APIRouter(prefix="/debug", tags=["debug"])
 
+# Snapshot the /memory endpoint diffs against; taken on first call or on reset
+_memory_baseline: Optional[tracemalloc.Snapshot] = None
+
 @debug_router.get("/db-schema")
 async def check_database_schema():
     """Check what database schema the app is actually seeing"""
     try:
         async with engine.begin() as conn:
-            # Check if tables exist
+            # Tables, inspected columns and connection info in a single round trip,
+            # tagged by kind and split apart in Python
             result = await conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
+                SELECT 'table' AS kind, tablename::text AS table_name, NULL AS column_name, NULL AS data_type, 0 AS position
+                FROM pg_catalog.pg_tables 
+                WHERE schemaname = 'public'
+                UNION ALL
+                SELECT 'column', table_name, column_name, data_type, ordinal_position
+                FROM information_schema.columns 
                 WHERE table_schema = 'public'
-                ORDER BY table_name
+                  AND table_name IN ('resume_roast_sessions', 'users')
+                UNION ALL
+                SELECT 'connection', current_database(), current_user, NULL, 0
+                ORDER BY kind, table_name, position
             """))
-            tables = [row[0] for row in result]
+            rows = result.all()
             
+            tables = [row[1] for row in rows if row[0] == 'table']
             schema_info = {"tables": tables}
             
-            # Check resume_roast_sessions columns if table exists
-            if 'resume_roast_sessions' in tables:
-                result = await conn.execute(text("""
-                    SELECT column_name, data_type 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'resume_roast_sessions' 
-                    ORDER BY ordinal_position
-                """))
-                schema_info["resume_roast_sessions_columns"] = [
-                    {"name": row[0], "type": row[1]} for row in result
-                ]
-            
-            # Check users columns if table exists
-            if 'users' in tables:
-                result = await conn.execute(text("""
-                    SELECT column_name, data_type 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'users' 
-                    ORDER BY ordinal_position
-                """))
-                schema_info["users_columns"] = [
-                    {"name": row[0], "type": row[1]} for row in result
+            column_rows = [row for row in rows if row[0] == 'column']
+            for table_name, table_rows in groupby(column_rows, key=itemgetter(1)):
+                schema_info[f"{table_name}_columns"] = [
+                    {"name": row[2], "type": row[3]} for row in table_rows
                 ]
             
             # Get database connection info
-            result = await conn.execute(text("SELECT current_database(), current_user"))
-            db_info = result.fetchone()
-            schema_info["database"] = db_info[0]
-            schema_info["user"] = db_info[1]
+            db_info = next(row for row in rows if row[0] == 'connection')
+            schema_info["database"] = db_info[1]
+            schema_info["user"] = db_info[2]
             
             return schema_info
             
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+@debug_router.get("/memory")
+async def check_memory_growth(reset: bool = False, limit: int = 10):
+    """
+    Report the source lines whose allocations grew most since the baseline snapshot.
+    
+    Hit it, exercise an endpoint repeatedly (e.g. a traced LLM chain), hit it again:
+    steady per-call growth points at a leak. Needs the process started with
+    PYTHONTRACEMALLOC=25 so tracing costs nothing when it is off.
+    """
+    global _memory_baseline
+    if not tracemalloc.is_tracing():
+        return {"tracing": False, "hint": "Start the app with PYTHONTRACEMALLOC=25 to enable"}
+    
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+    if _memory_baseline is None or reset:
+        _memory_baseline = snapshot
+        return {"tracing": True, "baseline": "captured"}
+    
+    current, peak = tracemalloc.get_traced_memory()
+    top_stats = snapshot.compare_to(_memory_baseline, "lineno")[:limit]
+    return {
+        "tracing": True,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "top_growth": [
+            {
+                "location": str(stat.traceback[0]),
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff
+            }
+            for stat in top_stats
+        ]
+    }
@@ -1,23 +1,37 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 
-# Configure application-wide logging
+# Configure application-wide logging. Records are handed to a background listener
+# thread, so request handlers on the event loop never block on stderr writes.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+# The queue handler only renders the message (and any traceback); the listener's handler adds the prefix
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(),
+        _log_queue_handler,
     ]
 )
+_log_listener.start()
+# Flush whatever is still queued when the process exits
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 from fastapi import FastAPI, Request, HTTPException, File, Form, UploadFile, Depends
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 import uvicorn
 import asyncio
+from datetime import datetime
 
 # Import configuration and routers
 from app.config import settings
@@ -34,7 +48,13 @@ from app.api.name_craft.router import router as name_craft_router
 from app.api.product_ideas.router import router as product_ideas_router
 
 # Import database configuration
-from app.core.database import init_db, close_db, get_db
+from app.core.database import init_db, close_db, get_db, AsyncSessionLocal
+from app.services.common import llm_service
+from app.services.skill_assessment_ai_service import skill_assessment_ai_service
+from app.services.resume_roasting_service import resume_roasting_service
+from app.services.document_processor import DocumentProcessor
+from app.services.data_sources.http_client import close_session as close_data_sources_session
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.database.user_service import UserService
 from app.schemas.user import UserCreate
@@ -47,6 +67,7 @@ app = FastAPI(
     description="Backend API for FaltuAI Fun application with Google OAuth and JWT authentication",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Add validation error handler
@@ -80,20 +101,46 @@ async def startup_event():
     """Initialize database on startup"""
     try:
         await init_db()
-        print("✅ Database initialized successfully")
+        logger.info("✅ Database initialized successfully")
     except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
+        logger.error(f"❌ Database initialization failed: {e}")
         # Don't fail startup if database is not available
         # This allows the app to run without database for testing
+    
+    # Warm the learning plan pipeline and LLM connections in the background so startup isn't delayed
+    app.state.warmup_task = asyncio.create_task(skill_assessment_ai_service.warmup())
+    app.state.llm_warmup_task = asyncio.create_task(llm_service.warmup())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Close database connections on shutdown"""
     try:
         await close_db()
-        print("✅ Database connections closed")
+        logger.info("✅ Database connections closed")
     except Exception as e:
-        print(f"❌ Database shutdown error: {e}")
+        logger.error(f"❌ Database shutdown error: {e}")
+    
+    # Stop warmups still in flight so they don't run against pools being closed below
+    warmups = [task for task in (app.state.warmup_task, app.state.llm_warmup_task) if not task.done()]
+    for task in warmups:
+        task.cancel()
+    await asyncio.gather(*warmups, return_exceptions=True)
+    
+    # Close every outbound connection pool concurrently; one failing close can't skip the others
+    pools = {
+        "LLM": llm_service.close,
+        "Data sources": close_data_sources_session,
+        "Google OAuth": google_oauth.close,
+    }
+    results = await asyncio.gather(
+        *(close() for close in pools.values()),
+        return_exceptions=True
+    )
+    for name, result in zip(pools, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ {name} connection pool shutdown error: {result}")
+        else:
+            logger.info(f"✅ {name} connection pool closed")
 
 # Include API routers
 app.include_router(resume_roast_router, prefix="/api/v1")
@@ -136,7 +183,6 @@ async def health_check():
     """
     Health check endpoint for monitoring
     """
-    from datetime import datetime
     return {
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -149,11 +195,6 @@ async def database_health_check():
     Database health check endpoint
     """
     try:
-        # Import here to avoid startup issues
-        from app.core.database import AsyncSessionLocal
-        from sqlalchemy import text
-        from datetime import datetime
-        
         async with AsyncSessionLocal() as session:
             result = await session.execute(text("SELECT 1"))
             row = result.fetchone()
@@ -185,15 +226,13 @@ async def test_roast(request: dict):
     FOR TESTING LANGSMITH TRACING ONLY
     """
     try:
-        from app.services.resume_roasting_service import resume_roasting_service
-        
         resume_text = request.get('resume_text', '')
         roast_style = request.get('roast_style', 'brutally_honest')
         
         if not resume_text:
             raise HTTPException(status_code=400, detail="resume_text is required")
         
-        print(f"🧪 Test roast request - Style: {roast_style}, Resume length: {len(resume_text)} chars")
+        logger.info(f"🧪 Test roast request - Style: {roast_style}, Resume length: {len(resume_text)} chars")
         
         # Call the roasting service
         result = await resume_roasting_service.roast_resume(
@@ -201,7 +240,7 @@ async def test_roast(request: dict):
             style=roast_style
         )
         
-        print(f"✅ Test roast completed - Response length: {len(result.get('roast', ''))} chars")
+        logger.info(f"✅ Test roast completed - Response length: {len(result.get('roast', ''))} chars")
         
         return {
             "roast": result.get('roast', 'No roast generated'),
@@ -223,17 +262,13 @@ async def test_upload_roast(file: UploadFile = File(...), roast_style: str = For
     FOR TESTING LANGSMITH TRACING WITH FILE UPLOADS
     """
     try:
-        from app.services.resume_roasting_service import resume_roasting_service
-        from app.services.document_processor import DocumentProcessor
-        from fastapi import File, Form, UploadFile
-        
-        print(f"🧪 Test file upload - Filename: {file.filename}, Style: {roast_style}")
+        logger.info(f"🧪 Test file upload - Filename: {file.filename}, Style: {roast_style}")
         
         # Process the uploaded file
         document_processor = DocumentProcessor()
         extracted_text = await document_processor.process_file(file)
         
-        print(f"📄 Text extracted - Length: {len(extracted_text)} chars")
+        logger.info(f"📄 Text extracted - Length: {len(extracted_text)} chars")
         
         if len(extracted_text) < 10:  # Lower threshold for testing
             raise HTTPException(
@@ -247,7 +282,7 @@ async def test_upload_roast(file: UploadFile = File(...), roast_style: str = For
             style=roast_style
         )
         
-        print(f"✅ Test file roast completed - Response length: {len(result.get('roast', ''))} chars")
+        logger.info(f"✅ Test file roast completed - Response length: {len(result.get('roast', ''))} chars")
         
         return {
             "roast": result.get('roast', 'No roast generated'),
@@ -311,14 +346,14 @@ async def google_callback(code: str = None, error: str = None):
         user_info = await google_oauth.handle_oauth_callback(code)
         
         # Extract user details
-        print(f"🔍 Google user info received: {user_info}")
         email = user_info.get('email')
         name = user_info.get('name', 'Unknown User')
         # Use email as the unique identifier if Google ID is not available
         google_id = user_info.get('sub') or user_info.get('id') or email
         avatar_url = user_info.get('picture')
         
-        print(f"📧 Extracted - Email: {email}, Google ID: {google_id}, Name: {name}")
+        # Single debug record per login; user_info also carries the Google access token, so it is never dumped
+        logger.debug(f"Google user info received - Email: {email}, Google ID: {google_id}, Name: {name}")
         
         if not email:
             raise HTTPException(status_code=400, detail=f"Missing required email from Google. Available fields: {list(user_info.keys())}")
@@ -326,7 +361,6 @@ async def google_callback(code: str = None, error: str = None):
         db_user = None
 
         # Create database session
-        from app.core.database import AsyncSessionLocal
         async with AsyncSessionLocal() as db:
             try:
                 # Check if user already exists
@@ -342,14 +376,14 @@ async def google_callback(code: str = None, error: str = None):
                     )
                     
                     db_user = await UserService.create_user(db, user_data)
-                    print(f"✅ Created new user: {email}")
+                    logger.info(f"Created new user: {email}")
                 else:
                     # Update existing user's last login and info
                     db_user = await UserService.update_last_login(db, existing_user.id)
-                    print(f"✅ Updated existing user login: {email}")
+                    logger.info(f"Updated existing user login: {email}")
                     
             except Exception as db_error:
-                print(f"Database error in OAuth callback: {db_error}")
+                logger.error(f"Database error in OAuth callback: {db_error}")
                 # Continue with token creation even if DB fails
                 pass
         
@@ -366,10 +400,8 @@ async def google_callback(code: str = None, error: str = None):
         return RedirectResponse(url=success_url)
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"OAuth callback error: {str(e)}")
-        print(f"Full traceback: {error_details}")
+        # One log record with the traceback attached instead of separate stdout writes
+        logger.exception(f"OAuth callback error: {str(e)}")
         error_url = f"{settings.FRONTEND_URL}/#/auth/callback?error=oauth_failed"
         return RedirectResponse(url=error_url)
 
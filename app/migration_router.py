@@ -3,19 +3,56 @@ Migration endpoint to fix database schema from within Container App
 """
 from fastapi import APIRouter, HTTPException
 from app.core.database import engine, Base
-from sqlalchemy import text
+from sqlalchemy import text, inspect
 
 migration_router = APIRouter(prefix="/migration", tags=["migration"])
 
+# Tables rebuilt by /recreate-schema; no other table holds a foreign key to them
+_RECREATED_TABLES = ("resume_roast_sessions", "user_activity_logs", "system_metrics")
+
+
+def _schema_matches_models(sync_conn) -> bool:
+    """Whether every recreated table already has the model's columns, types and nullability"""
+    import app.models  # noqa: F401 - register all models on Base.metadata
+    
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    for table_name in _RECREATED_TABLES:
+        table = Base.metadata.tables.get(table_name)
+        if table is None or table_name not in existing_tables:
+            return False
+        
+        reflected = {column["name"]: column for column in inspector.get_columns(table_name)}
+        if reflected.keys() != set(table.columns.keys()):
+            return False
+        for column in table.columns:
+            db_column = reflected[column.name]
+            if (db_column["type"]._type_affinity is not column.type._type_affinity
+                    or db_column["nullable"] != column.nullable):
+                return False
+    return True
+
 @migration_router.post("/recreate-schema")
 async def recreate_database_schema():
     """Recreate database schema to match current models"""
     try:
         async with engine.begin() as conn:
-            # Drop existing tables
-            await conn.execute(text("DROP TABLE IF EXISTS resume_roast_sessions CASCADE"))
-            await conn.execute(text("DROP TABLE IF EXISTS user_activity_logs CASCADE"))
-            await conn.execute(text("DROP TABLE IF EXISTS system_metrics CASCADE"))
+            # Schema already matches the models: only the data needs resetting, and
+            # TRUNCATE does that without rebuilding tables, indexes and sequences
+            if await conn.run_sync(_schema_matches_models):
+                await conn.execute(text(
+                    f"TRUNCATE TABLE {', '.join(_RECREATED_TABLES)} RESTART IDENTITY"
+                ))
+                return {
+                    "status": "success",
+                    "message": "Database schema already matches current models",
+                    "action": "Tables truncated; schema left unchanged"
+                }
+            
+            # Drop existing tables in one statement (one round trip, one lock acquisition pass)
+            await conn.execute(text(
+                f"DROP TABLE IF EXISTS {', '.join(_RECREATED_TABLES)} CASCADE"
+            ))
             
             # Recreate tables with correct schema
             await conn.run_sync(Base.metadata.create_all)
@@ -3,6 +3,9 @@ Database model for caching market research data
 Stores API responses to reduce costs and improve performance
 """
 
+import hashlib
+import json
+
 from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from datetime import datetime, timedelta
@@ -56,9 +59,6 @@ class MarketResearchCache(Base):
         Returns:
             SHA256 hash of the normalized parameters
         """
-        import hashlib
-        import json
-        
         # Sort parameters for consistent hashing
         normalized = json.dumps(kwargs, sort_keys=True)
         key_string = f"{source}:{normalized}"
@@ -1,7 +1,10 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, AliasChoices, validator, field_validator
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from enum import Enum
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Enums
 class ExperienceLevel(str, Enum):
@@ -14,6 +17,27 @@ class DifficultyLevel(str, Enum):
     MEDIUM = "medium"
     HARD = "hard"
 
+# Difficulty strings returned by the LLM mapped onto DifficultyLevel
+DIFFICULTY_ALIASES: Dict[str, DifficultyLevel] = {
+    "beginner": DifficultyLevel.EASY,
+    "easy": DifficultyLevel.EASY,
+    "intermediate": DifficultyLevel.MEDIUM,
+    "medium": DifficultyLevel.MEDIUM,
+    "advanced": DifficultyLevel.HARD,
+    "hard": DifficultyLevel.HARD,
+    "expert": DifficultyLevel.HARD
+}
+
+def _coerce_difficulty(value: Any) -> Any:
+    """Accept any known difficulty alias, defaulting unknown strings to medium"""
+    if isinstance(value, str) and not isinstance(value, DifficultyLevel):
+        difficulty = DIFFICULTY_ALIASES.get(value.lower())
+        if difficulty is None:
+            logger.warning(f"Unknown difficulty '{value}', defaulting to medium")
+            return DifficultyLevel.MEDIUM
+        return difficulty
+    return value
+
 class QuestionType(str, Enum):
     MULTIPLE_CHOICE = "multiple_choice"
     SCENARIO_BASED = "scenario_based"
@@ -80,33 +104,41 @@ class EvaluationSummary(BaseModel):
 
 class LearningResource(BaseModel):
     title: str = Field(..., description="Resource title")
-    type: str = Field(..., description="Resource type (course, book, tutorial, etc.)")
-    url: Optional[str] = Field(None, description="Resource URL")
-    cost: str = Field(..., description="Cost information (Free, $X, etc.)")
-    difficulty: DifficultyLevel = Field(..., description="Resource difficulty level")
-    estimated_hours: Optional[float] = Field(None, description="Estimated study hours (can be fractional)")
+    type: str = Field(default="course", description="Resource type (course, book, tutorial, etc.)")
+    url: Optional[str] = Field(
+        ...,
+        validation_alias=AliasChoices("url_pattern", "url"),
+        description="Resource URL"
+    )
+    cost: str = Field(default="Free", description="Cost information (Free, $X, etc.)")
+    difficulty: DifficultyLevel = Field(default=DifficultyLevel.MEDIUM, description="Resource difficulty level")
+    estimated_hours: Optional[float] = Field(default=10, description="Estimated study hours (can be fractional)")
+
+    _normalize_difficulty = field_validator("difficulty", mode="before")(_coerce_difficulty)
 
 class LearningModule(BaseModel):
     title: str = Field(..., description="Module title")
-    description: str = Field(..., description="Module description")
-    duration_weeks: int = Field(..., ge=1, description="Module duration in weeks")
+    description: str = Field(default="", description="Module description")
+    duration_weeks: int = Field(default=2, ge=1, description="Module duration in weeks")
     resources: List[LearningResource] = Field(default=[], description="Recommended resources")
     learning_objectives: List[str] = Field(default=[], description="Learning objectives for this module")
     weekly_breakdown: List[Dict[str, Any]] = Field(default=[], description="Week-by-week breakdown of the module")
 
 class ProjectIdea(BaseModel):
     title: str = Field(..., description="Project title")
-    description: str = Field(..., description="Project description")
-    difficulty: DifficultyLevel = Field(..., description="Project difficulty")
+    description: str = Field(default="", description="Project description")
+    difficulty: DifficultyLevel = Field(default=DifficultyLevel.MEDIUM, description="Project difficulty")
     duration_weeks: int = Field(default=2, description="Estimated project duration in weeks")
     technologies: List[str] = Field(default=[], description="Technologies used in project")
     learning_objectives: List[str] = Field(default=[], description="Skills this project helps develop")
 
+    _normalize_difficulty = field_validator("difficulty", mode="before")(_coerce_difficulty)
+
 class MarketTrend(BaseModel):
-    trend_name: str = Field(..., description="Market trend name")
-    relevance_score: int = Field(..., ge=0, le=100, description="Relevance score 0-100")
-    time_to_learn_weeks: int = Field(..., ge=1, description="Estimated time to learn in weeks")
-    job_market_impact: str = Field(..., description="Impact on job market")
+    trend_name: str = Field(default="", description="Market trend name")
+    relevance_score: int = Field(default=80, ge=0, le=100, description="Relevance score 0-100")
+    time_to_learn_weeks: int = Field(default=4, ge=1, description="Estimated time to learn in weeks")
+    job_market_impact: str = Field(default="", description="Impact on job market")
     resources: List[str] = Field(default=[], description="Learning resources for this trend")
 
 class LearningPlanResponse(BaseModel):
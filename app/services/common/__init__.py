@@ -3,12 +3,15 @@ Common Services Package
 Exports all common service utilities
 """
 
-from .llm_service import llm_service, LLMService
+from .llm_service import llm_service, LLMService, loads_json
 from .database_service import db_service, DatabaseService
+from .prompt_batcher import PromptBatcher
 
 __all__ = [
     'llm_service',
     'LLMService', 
+    'loads_json',
     'db_service',
-    'DatabaseService'
+    'DatabaseService',
+    'PromptBatcher'
 ]
\ No newline at end of file
@@ -3,26 +3,100 @@ Common LLM Service Library
 Provides reusable utilities for LLM interactions across the application
 """
 import json
+import re
 import asyncio
-from typing import Dict, Any, Optional, List
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 import logging
 import os
 
+from app.utils.json_utils import loads_json
+
 logger = logging.getLogger(__name__)
 
+# Max structured responses kept in the in-process LRU cache (only calls that pass cache_ttl are cached)
+_MAX_CACHED_RESPONSES = 512
+
 class LLMService:
     """Centralized service for all LLM operations"""
     
     def __init__(self):
-        self.client = ChatOpenAI(
+        # Single keep-alive HTTP/2 connection pool shared by every ChatOpenAI client,
+        # so concurrent calls multiplex over warm connections instead of new TLS handshakes
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60)
+        )
+        # Clients keyed by (temperature, max_tokens, json_mode, streaming); built once, reused per call
+        self._clients: Dict[Tuple[float, int, bool, bool], ChatOpenAI] = {}
+        self.client = self._get_client(temperature=0.7, max_tokens=2000)
+        # digest of the full request -> (monotonic expiry, raw JSON text of the structured response)
+        self._response_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+    
+    @property
+    def is_pooled(self) -> bool:
+        """Whether LLM calls are going through the shared connection pool"""
+        return not self._http_client.is_closed
+    
+    def _create_client(self, temperature: float, max_tokens: int, **kwargs) -> ChatOpenAI:
+        """Create a ChatOpenAI client bound to the shared connection pool"""
+        return ChatOpenAI(
             model_name="gpt-4o-mini",
             openai_api_key=os.getenv("OPENAI_API_KEY"),
-            temperature=0.7,
-            max_tokens=2000
+            temperature=temperature,
+            max_tokens=max_tokens,
+            http_async_client=self._http_client,
+            **kwargs
         )
     
+    def _get_client(
+        self,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = False,
+        streaming: bool = False
+    ) -> ChatOpenAI:
+        """Return the cached client for this configuration, creating it on first use"""
+        key = (temperature, max_tokens, json_mode, streaming)
+        client = self._clients.get(key)
+        if client is None:
+            kwargs: Dict[str, Any] = {}
+            if json_mode:
+                kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
+            if streaming:
+                kwargs["streaming"] = True
+            client = self._clients[key] = self._create_client(temperature, max_tokens, **kwargs)
+        return client
+    
+    async def warmup(self):
+        """
+        Open a connection to the OpenAI API ahead of the first request so the
+        TLS handshake isn't paid on a user's critical path. Best-effort.
+        """
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return
+        
+        base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+        try:
+            await self._http_client.get(
+                f"{base_url}/models",
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=10
+            )
+            logger.info("LLM connection pool warmed up")
+        except Exception as e:
+            logger.warning(f"LLM connection pool warmup failed: {e}")
+    
+    async def close(self):
+        """Close the shared connection pool"""
+        await self._http_client.aclose()
+    
     async def call_async(
         self, 
         prompt: str, 
@@ -35,13 +109,7 @@ class LLMService:
         Generic async LLM call with configurable parameters
         """
         try:
-            # Configure client for this call
-            client = ChatOpenAI(
-                model_name="gpt-4o-mini",
-                openai_api_key=os.getenv("OPENAI_API_KEY"),
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+            client = self._get_client(temperature=temperature, max_tokens=max_tokens)
             
             messages = []
             if system_message:
@@ -83,29 +151,39 @@ class LLMService:
         prompt: str,
         schema_description: str,
         system_message: Optional[str] = None,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        max_tokens: int = 8000,  # Increased for detailed curriculum design
+        cache_ttl: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Generate structured JSON response following a specific schema
         Uses OpenAI's JSON mode for guaranteed valid JSON
+        
+        Responses are cached for `cache_ttl` seconds only when it is given; leave it
+        unset for prompts whose output must vary per call (e.g. quiz generation)
         """
-        full_prompt = f"""
-{prompt}
-
-RESPONSE SCHEMA:
-{schema_description}
-
-Generate a valid JSON response matching the schema above.
-"""
+        full_prompt = self._build_structured_prompt(prompt, schema_description)
+        
+        cache_key = None
+        if cache_ttl:
+            cache_key = hashlib.blake2b(
+                f"{temperature}|{max_tokens}|{system_message or ''}|{full_prompt}".encode(),
+                digest_size=16
+            ).digest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                    # Decode the stored text so every caller gets its own mutable copy
+                    return loads_json(cached[1])
+                del self._response_cache[cache_key]
         
         try:
             # Use OpenAI's JSON mode for guaranteed valid JSON
-            client = ChatOpenAI(
-                model_name="gpt-4o-mini",
-                openai_api_key=os.getenv("OPENAI_API_KEY"),
+            client = self._get_client(
                 temperature=temperature,
-                max_tokens=8000,  # Increased for detailed curriculum design
-                model_kwargs={"response_format": {"type": "json_object"}}
+                max_tokens=max_tokens,
+                json_mode=True
             )
             
             messages = []
@@ -114,7 +192,14 @@ Generate a valid JSON response matching the schema above.
             messages.append(HumanMessage(content=full_prompt))
             
             response = await client.ainvoke(messages)
-            return json.loads(response.content.strip())
+            content = response.content.strip()
+            data = loads_json(content)
+            
+            if cache_key is not None:
+                self._response_cache[cache_key] = (time.monotonic() + cache_ttl, content)
+                if len(self._response_cache) > _MAX_CACHED_RESPONSES:
+                    self._response_cache.popitem(last=False)
+            return data
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {response.content}")
@@ -123,6 +208,70 @@ Generate a valid JSON response matching the schema above.
             logger.error(f"Structured response generation failed: {e}")
             raise Exception(f"LLM service error: {str(e)}")
     
+    async def generate_structured_response_stream(
+        self,
+        prompt: str,
+        schema_description: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """
+        Stream a structured JSON response as raw text chunks while the model emits them
+        """
+        full_prompt = self._build_structured_prompt(prompt, schema_description)
+        
+        client = self._get_client(
+            temperature=temperature,
+            max_tokens=8000,
+            json_mode=True,
+            streaming=True
+        )
+        
+        messages = []
+        if system_message:
+            messages.append(SystemMessage(content=system_message))
+        messages.append(HumanMessage(content=full_prompt))
+        
+        try:
+            async for chunk in client.astream(messages):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            logger.error(f"Structured response stream failed: {e}")
+            raise Exception(f"LLM service error: {str(e)}")
+    
+    async def stream_json_array_items(
+        self,
+        prompt: str,
+        schema_description: str,
+        array_key: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.3
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a structured response and yield each item of the top-level
+        `array_key` array as soon as its closing brace arrives
+        """
+        chunks = self.generate_structured_response_stream(
+            prompt=prompt,
+            schema_description=schema_description,
+            system_message=system_message,
+            temperature=temperature
+        )
+        async for item in iter_json_array_items(chunks, array_key):
+            yield item
+    
+    def _build_structured_prompt(self, prompt: str, schema_description: str) -> str:
+        """Append the response schema instructions to a prompt"""
+        return f"""
+{prompt}
+
+RESPONSE SCHEMA:
+{schema_description}
+
+Generate a valid JSON response matching the schema above.
+"""
+    
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -142,12 +291,7 @@ Generate a valid JSON response matching the schema above.
                     formatted_messages.append(HumanMessage(content=msg["content"]))
                 # Note: LangChain doesn't have direct AssistantMessage, would need AIMessage
             
-            client = ChatOpenAI(
-                model_name="gpt-4o-mini",
-                openai_api_key=os.getenv("OPENAI_API_KEY"),
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+            client = self._get_client(temperature=temperature, max_tokens=max_tokens)
             
             response = await client.ainvoke(formatted_messages)
             return response.content.strip()
@@ -156,5 +300,51 @@ Generate a valid JSON response matching the schema above.
             logger.error(f"Chat completion failed: {e}")
             raise Exception(f"Chat completion error: {str(e)}")
 
+async def iter_json_array_items(
+    chunks: AsyncIterator[str],
+    array_key: str
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Incrementally parse streamed JSON text and yield the items of the
+    `array_key` array one by one, without waiting for the full document.
+    
+    Raises json.JSONDecodeError if the stream ends before the array is found
+    or closed (e.g. the response was truncated at max_tokens), so callers
+    retry or fall back instead of accepting a partial list.
+    """
+    decoder = json.JSONDecoder()
+    array_start = re.compile(rf'"{re.escape(array_key)}"\s*:\s*\[')
+    buffer = ""
+    in_array = False
+    
+    async for chunk in chunks:
+        buffer += chunk
+        
+        if not in_array:
+            match = array_start.search(buffer)
+            if not match:
+                continue
+            buffer = buffer[match.end():]
+            in_array = True
+        
+        while True:
+            # Skip separators between items
+            buffer = buffer.lstrip(" \t\r\n,")
+            if not buffer:
+                break
+            if buffer[0] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # Item is still incomplete - wait for more chunks
+                break
+            buffer = buffer[end:]
+            yield item
+    
+    if not in_array:
+        raise json.JSONDecodeError(f'"{array_key}" array not found in streamed response', buffer, 0)
+    raise json.JSONDecodeError(f'"{array_key}" array not closed before the stream ended', buffer, len(buffer))
+
 # Global instance
 llm_service = LLMService()
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Prompt Batcher
+Coalesces structured LLM requests that arrive within a short window into a
+single multi-prompt call and fans the responses back out to each caller
+"""
+import asyncio
+from typing import Dict, Any, Optional, List, Hashable, Set, Tuple
+import logging
+
+from .llm_service import llm_service
+
+logger = logging.getLogger(__name__)
+
+# (key, prompt, future, expected output tokens) queued for the next batch
+_BatchItem = Tuple[Hashable, str, asyncio.Future, int]
+
+# Output budget for one batched call; structured calls are capped at 8000 tokens and the
+# batch wrapper needs headroom, so larger combinations are split across calls
+_MAX_BATCH_OUTPUT_TOKENS = 6000
+
+
+class PromptBatcher:
+    """
+    Micro-batcher for structured LLM prompts sharing the same response schema.
+
+    - Requests with an identical key that are already in flight share one result
+    - Distinct requests arriving within `window_seconds` are sent as one LLM call
+      asking the model for a JSON object mapping request id -> response, as long as
+      their expected output fits one call's token budget
+    - Prompts of a failed or incomplete batch are retried individually
+    """
+
+    def __init__(
+        self,
+        schema_description: str,
+        temperature: float = 0.7,
+        window_seconds: float = 0.05,
+        max_batch_size: int = 4,
+        max_batch_tokens: int = _MAX_BATCH_OUTPUT_TOKENS
+    ):
+        self.schema_description = schema_description
+        self.temperature = temperature
+        self.window_seconds = window_seconds
+        # Kept small: every batched response shares the single call's max_tokens budget
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        # The event loop only keeps weak references to tasks; hold in-flight dispatches here
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, prompt: str, expected_tokens: int = 0) -> Dict[str, Any]:
+        """
+        Queue a prompt for the next batch and wait for its structured response.
+        `expected_tokens` estimates the response size and limits what it is batched with.
+        """
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._ensure_worker()
+            self._queue.put_nowait((key, prompt, future, expected_tokens))
+
+        # Shield so one cancelled caller does not cancel the result for the others
+        return await asyncio.shield(future)
+
+    def _ensure_worker(self):
+        """Start the background drain task on first use (needs a running loop)"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain_queue())
+
+    async def _drain_queue(self):
+        """Group queued prompts into windows and dispatch each window as one call"""
+        loop = asyncio.get_running_loop()
+        # Item that did not fit the previous batch's token budget; it opens the next one
+        carry: Optional[_BatchItem] = None
+        while True:
+            first = carry or await self._queue.get()
+            carry = None
+            batch: List[_BatchItem] = [first]
+            batch_tokens = first[3]
+            deadline = loop.time() + self.window_seconds
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if batch_tokens + item[3] > self.max_batch_tokens:
+                    carry = item
+                    break
+                batch.append(item)
+                batch_tokens += item[3]
+
+            # Dispatch without blocking the next window
+            dispatch = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[_BatchItem]):
+        """Send a batch to the LLM and resolve every caller's future"""
+        if len(batch) == 1:
+            try:
+                result = await self._call_single(batch[0][1])
+            except Exception as e:
+                logger.error(f"LLM call failed: {e}")
+                result = e
+            self._resolve(batch[0], result)
+            return
+
+        try:
+            responses = await self._call_batched([item[1] for item in batch])
+        except Exception as e:
+            # e.g. the combined response was truncated; don't fail every caller with it
+            logger.warning(f"Batched LLM call failed ({e}), retrying {len(batch)} prompts individually")
+            responses = {}
+
+        missing = []
+        for request_id, item in enumerate(batch, start=1):
+            response = responses.get(str(request_id))
+            if isinstance(response, dict):
+                self._resolve(item, response)
+            else:
+                missing.append(item)
+
+        if missing:
+            if responses:
+                # Model dropped some ids - retry those individually
+                logger.warning(f"Batched LLM call missed {len(missing)}/{len(batch)} responses, retrying individually")
+            results = await asyncio.gather(
+                *(self._call_single(item[1]) for item in missing),
+                return_exceptions=True
+            )
+            for item, result in zip(missing, results):
+                self._resolve(item, result)
+
+    async def _call_single(self, prompt: str) -> Dict[str, Any]:
+        return await llm_service.generate_structured_response(
+            prompt=prompt,
+            schema_description=self.schema_description,
+            temperature=self.temperature
+        )
+
+    async def _call_batched(self, prompts: List[str]) -> Dict[str, Any]:
+        requests_text = "\n\n".join(
+            f"[{request_id}]\n{prompt.strip()}"
+            for request_id, prompt in enumerate(prompts, start=1)
+        )
+        batched_prompt = f"""
+You will handle {len(prompts)} independent requests. Answer each one separately and completely.
+
+Requests:
+{requests_text}
+"""
+        batched_schema = f"""
+{{
+  "responses": {{
+    "1": <response to request [1]>,
+    "2": <response to request [2]>
+  }}
+}}
+
+Each response must follow this schema:
+{self.schema_description}
+"""
+        data = await llm_service.generate_structured_response(
+            prompt=batched_prompt,
+            schema_description=batched_schema,
+            temperature=self.temperature
+        )
+        return data.get("responses", {})
+
+    def _resolve(self, item: _BatchItem, result: Any):
+        key, _, future, _ = item
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if future.done():
+            return
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
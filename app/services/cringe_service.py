@@ -4,7 +4,6 @@ from pathlib import Path
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from langsmith import Client
 
 from app.config import settings
 from app.schemas.cringe import CringeResponse
@@ -20,13 +19,6 @@ class CringeService:
             os.environ["LANGCHAIN_API_KEY"] = settings.LANGCHAIN_API_KEY or ""
             os.environ["LANGCHAIN_PROJECT"] = settings.LANGCHAIN_PROJECT or "faltuai-fun"
 
-        self.langsmith_client = None
-        try:
-            self.langsmith_client = Client()
-            logger.info("LangSmith client initialized for CringeService")
-        except Exception as exc:
-            logger.warning(f"LangSmith client initialization failed: {exc}")
-
         self.llm = ChatOpenAI(
             openai_api_key=settings.OPENAI_API_KEY,
             model=settings.OPENAI_MODEL,
@@ -34,6 +26,7 @@ class CringeService:
         )
 
         self.prompt_path = Path(__file__).resolve().parents[1] / "prompts" / "cringe_analyzer.md"
+        self._chain = None
 
     def _load_system_prompt(self) -> str:
         if not self.prompt_path.exists():
@@ -41,22 +34,28 @@ class CringeService:
 
         return self.prompt_path.read_text(encoding="utf-8").strip()
 
+    def _get_chain(self):
+        # Prompt file is read and the prompt/structured-output chain compiled once, on first use
+        if self._chain is None:
+            system_prompt = self._load_system_prompt()
+
+            prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", system_prompt),
+                    ("human", "Analyze this LinkedIn post and return only structured output:\n\n{content}"),
+                ]
+            )
+
+            self._chain = prompt | self.llm.with_structured_output(CringeResponse)
+        return self._chain
+
     async def analyze_post(self, content: str) -> CringeResponse:
         cleaned_content = (content or "").strip()
 
         if len(cleaned_content) < 10:
             raise ValueError("Post content is too short. Please provide at least 10 characters.")
 
-        system_prompt = self._load_system_prompt()
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_prompt),
-                ("human", "Analyze this LinkedIn post and return only structured output:\n\n{content}"),
-            ]
-        )
-
-        chain = prompt | self.llm.with_structured_output(CringeResponse)
+        chain = self._get_chain()
 
         result = await chain.ainvoke(
             {"content": cleaned_content},
@@ -6,7 +6,7 @@ Manages cache lifecycle and provides unified interface for all data sources
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 import logging
 import asyncio
 
@@ -178,7 +178,6 @@ class MarketResearchCacheService:
             active_entries = total_entries - expired_entries
             
             # Get stats by source
-            from sqlalchemy import func
             source_stats = self.db.query(
                 MarketResearchCache.source,
                 func.count(MarketResearchCache.id).label('count'),
@@ -10,13 +10,23 @@ Uses GitHub's public API to fetch:
 
 import aiohttp
 import asyncio
-from typing import Dict, Any, List, Optional
+import copy
+import heapq
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 import os
 
+from app.utils.json_utils import loads_json
+from app.services.data_sources.http_client import AsyncRateLimiter, TTLCache, get_session, read_error_text
+
 logger = logging.getLogger(__name__)
 
+# Repository star counts move slowly, so search results stay useful for a day
+_SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+_MAX_CACHED_SEARCHES = 256
+
 
 class GitHubTrendsAgent:
     """Agent for analyzing technology trends using GitHub API"""
@@ -24,28 +34,26 @@ class GitHubTrendsAgent:
     def __init__(self, api_token: Optional[str] = None):
         self.api_token = api_token or os.getenv("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
-        self.session: Optional[aiohttp.ClientSession] = None
-        
-        # GitHub API: 5000 requests/hour with auth, 60 without
+        self._headers = {"Accept": "application/vnd.github.v3+json"}
+        if self.api_token:
+            self._headers["Authorization"] = f"token {self.api_token}"
+        
+        # GitHub API: 5000 requests/hour with auth, 60 without;
+        # the search endpoint has its own limit of 30 requests/minute with auth, 10 without
+        self._search_limiter = AsyncRateLimiter(max_rate=30 if self.api_token else 10, time_period=60)
+        # (query, sort, order, per_page) -> repositories
+        self._search_cache = TTLCache(_SEARCH_CACHE_TTL_SECONDS, _MAX_CACHED_SEARCHES)
+        # Searches in flight, shared by concurrent identical callers (e.g. the skill-gap and
+        # tech-trend research steps both analyzing the same technology)
+        self._inflight_searches: Dict[Tuple, asyncio.Task] = {}
         logger.info(f"GitHub API initialized {'with' if self.api_token else 'without'} authentication")
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session with GitHub auth"""
-        if self.session is None or self.session.closed:
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "FaltuAI-Learning-Plan-Agent"
-            }
-            if self.api_token:
-                headers["Authorization"] = f"token {self.api_token}"
-            
-            self.session = aiohttp.ClientSession(headers=headers)
-        return self.session
+        """Get the shared data source session"""
+        return await get_session()
     
     async def close(self):
-        """Close aiohttp session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op: the session is shared by every agent and closed once at app shutdown"""
     
     async def search_repositories(
         self,
@@ -63,24 +71,43 @@ class GitHubTrendsAgent:
             order: asc or desc
             per_page: Results per page (max 100)
         """
+        cache_key = (query, sort, order, min(per_page, 100))
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"GitHub cache hit: {query}")
+            return cached
+        
+        search = self._inflight_searches.get(cache_key)
+        if search is None:
+            search = asyncio.create_task(self._fetch_repositories(cache_key))
+            self._inflight_searches[cache_key] = search
+            search.add_done_callback(lambda _: self._inflight_searches.pop(cache_key, None))
+        
+        # Shield so one cancelled caller does not cancel the search for the others
+        return copy.deepcopy(await asyncio.shield(search))
+    
+    async def _fetch_repositories(self, cache_key: Tuple) -> List[Dict[str, Any]]:
+        """Run one repository search against the API and cache a successful result"""
+        query, sort, order, per_page = cache_key
         endpoint = f"{self.base_url}/search/repositories"
         params = {
             "q": query,
             "sort": sort,
             "order": order,
-            "per_page": min(per_page, 100)
+            "per_page": per_page
         }
         
         try:
             session = await self._get_session()
-            async with session.get(endpoint, params=params) as response:
+            async with self._search_limiter, session.get(endpoint, params=params, headers=self._headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     repos = data.get("items", [])
                     logger.info(f"Found {len(repos)} repositories for '{query}'")
+                    self._search_cache.put(cache_key, repos)
                     return repos
                 else:
-                    error_text = await response.text()
+                    error_text = await read_error_text(response)
                     logger.error(f"GitHub API error {response.status}: {error_text}")
                     return []
         except Exception as e:
@@ -124,18 +151,11 @@ class GitHubTrendsAgent:
         avg_stars = total_stars / len(repos) if repos else 0
         
         # Get top repositories
-        top_repos = sorted(repos, key=lambda r: r.get("stargazers_count", 0), reverse=True)[:10]
+        top_repos = heapq.nlargest(10, repos, key=lambda r: r.get("stargazers_count", 0))
         
         # Extract common topics/tags
-        all_topics = []
-        for repo in repos:
-            all_topics.extend(repo.get("topics", []))
-        
-        topic_counts = {}
-        for topic in all_topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        trending_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        topic_counts = Counter(topic for repo in repos for topic in repo.get("topics", []))
+        trending_topics = topic_counts.most_common(10)
         
         return {
             "technology": technology,
@@ -184,11 +204,9 @@ class GitHubTrendsAgent:
             f"learn {topic} stars:>50"
         ]
         
-        all_repos = []
-        for query in queries:
-            repos = await self.search_repositories(query, per_page=15)
-            all_repos.extend(repos)
-            await asyncio.sleep(0.5)  # Rate limiting
+        # Searches are paced by the search rate limiter, so they can be issued together
+        results = await asyncio.gather(*(self.search_repositories(query, per_page=15) for query in queries))
+        all_repos = [repo for repos in results for repo in repos]
         
         # Deduplicate by repository ID
         seen_ids = set()
@@ -200,7 +218,7 @@ class GitHubTrendsAgent:
                 unique_repos.append(repo)
         
         # Sort by stars and filter
-        learning_repos = sorted(unique_repos, key=lambda r: r.get("stargazers_count", 0), reverse=True)[:20]
+        learning_repos = heapq.nlargest(20, unique_repos, key=lambda r: r.get("stargazers_count", 0))
         
         return [
             {
@@ -231,15 +249,17 @@ class GitHubTrendsAgent:
         
         comparison = {}
         
-        for framework in frameworks:
-            adoption_data = await self.analyze_technology_adoption(framework, language)
+        adoption_results = await asyncio.gather(
+            *(self.analyze_technology_adoption(framework, language) for framework in frameworks)
+        )
+        for framework, adoption_data in zip(frameworks, adoption_results):
+            top_repositories = adoption_data.get("top_repositories")
             comparison[framework] = {
                 "total_repos": adoption_data.get("total_repositories", 0),
                 "total_stars": adoption_data.get("total_stars", 0),
                 "average_stars": adoption_data.get("average_stars", 0),
-                "top_repo": adoption_data.get("top_repositories", [{}])[0] if adoption_data.get("top_repositories") else {}
+                "top_repo": top_repositories[0] if top_repositories else {}
             }
-            await asyncio.sleep(0.5)  # Rate limiting
         
         # Rank frameworks by popularity
         ranked = sorted(
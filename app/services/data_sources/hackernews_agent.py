@@ -14,26 +14,30 @@ from datetime import datetime, timedelta
 import logging
 import re
 
+from app.utils.json_utils import loads_json
+from app.services.data_sources.http_client import TTLCache, get_session
+
 logger = logging.getLogger(__name__)
 
+# Hiring threads and front-page discussions change by the minute; keep searches only briefly
+_SEARCH_CACHE_TTL_SECONDS = 5 * 60
+_MAX_CACHED_SEARCHES = 128
+
 
 class HackerNewsAgent:
     """Agent for analyzing job market through HackerNews"""
     
     def __init__(self):
         self.base_url = "https://hacker-news.firebaseio.com/v0"
-        self.session: Optional[aiohttp.ClientSession] = None
+        # (query, limit) -> hits
+        self._search_cache = TTLCache(_SEARCH_CACHE_TTL_SECONDS, _MAX_CACHED_SEARCHES)
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
+        """Get the shared data source session"""
+        return await get_session()
     
     async def close(self):
-        """Close aiohttp session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op: the session is shared by every agent and closed once at app shutdown"""
     
     async def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get a single item (story, comment, etc.)"""
@@ -41,7 +45,7 @@ class HackerNewsAgent:
             session = await self._get_session()
             async with session.get(f"{self.base_url}/item/{item_id}.json") as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=loads_json)
         except Exception as e:
             logger.error(f"Failed to fetch HN item {item_id}: {e}")
         return None
@@ -50,6 +54,12 @@ class HackerNewsAgent:
         """
         Search HackerNews stories using Algolia HN Search API
         """
+        cache_key = (query, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"HackerNews cache hit: {query}")
+            return cached
+        
         search_url = "https://hn.algolia.com/api/v1/search"
         params = {
             "query": query,
@@ -61,8 +71,10 @@ class HackerNewsAgent:
             session = await self._get_session()
             async with session.get(search_url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return data.get("hits", [])
+                    data = await response.json(loads=loads_json)
+                    hits = data.get("hits", [])
+                    self._search_cache.put(cache_key, hits)
+                    return hits
         except Exception as e:
             logger.error(f"HN search failed for '{query}': {e}")
         return []
@@ -121,35 +133,36 @@ class HackerNewsAgent:
         """
         logger.info(f"Analyzing job requirements for {skill_area}")
         
-        # Get recent hiring threads
-        threads = await self.get_who_is_hiring_threads(months_back)
+        # Search for job posts mentioning the skill
+        search_queries = [
+            f"{skill_area} Who is Hiring",
+            f"{role} {skill_area} hiring" if role else f"{skill_area} engineer hiring"
+        ]
+        
+        # The job-post searches are independent of the thread lookup, so start them alongside it
+        searches = [
+            asyncio.create_task(self.search_stories(query, limit=30))
+            for query in search_queries
+        ]
+        try:
+            threads = await self.get_who_is_hiring_threads(months_back)
+        except BaseException:
+            for search in searches:
+                search.cancel()
+            raise
         
         if not threads:
+            # Nothing to analyze; don't leave the searches running (or filling the cache) for nothing
+            for search in searches:
+                search.cancel()
             return {
                 "skill_area": skill_area,
                 "data_available": False,
                 "message": "No recent hiring threads found"
             }
         
-        # Fetch comments from threads (job postings are in comments)
-        all_job_posts = []
-        
-        for thread in threads[:2]:  # Analyze top 2 most recent threads
-            thread_id = thread.get("id")
-            # Note: We'd need to fetch the full thread with comments
-            # For now, we'll use search to find relevant job posts
-            await asyncio.sleep(0.5)
-        
-        # Search for job posts mentioning the skill
-        search_queries = [
-            f"{skill_area} Who is Hiring",
-            f"{role} {skill_area} hiring" if role else f"{skill_area} engineer hiring"
-        ]
-        
-        for query in search_queries:
-            results = await self.search_stories(query, limit=30)
-            all_job_posts.extend(results)
-            await asyncio.sleep(0.5)
+        search_results = await asyncio.gather(*searches)
+        all_job_posts = [post for results in search_results for post in results]
         
         # Extract insights from job posts
         skills_mentioned = self._extract_skills(all_job_posts, skill_area)
@@ -175,12 +188,13 @@ class HackerNewsAgent:
             session = await self._get_session()
             async with session.get(f"{self.base_url}/topstories.json") as response:
                 if response.status == 200:
-                    story_ids = await response.json()
+                    story_ids = await response.json(loads=loads_json)
                     
-                    # Fetch top stories
+                    # Fetch top stories concurrently; the shared connector caps per-host connections
+                    top_ids = story_ids[:limit]
+                    items = await asyncio.gather(*(self.get_item(story_id) for story_id in top_ids))
                     stories = []
-                    for story_id in story_ids[:limit]:
-                        item = await self.get_item(story_id)
+                    for story_id, item in zip(top_ids, items):
                         if item and item.get("type") == "story":
                             stories.append({
                                 "title": item.get("title"),
@@ -190,7 +204,6 @@ class HackerNewsAgent:
                                 "time": item.get("time"),
                                 "hn_url": f"https://news.ycombinator.com/item?id={story_id}"
                             })
-                        await asyncio.sleep(0.1)  # Rate limiting
                     
                     return stories
         except Exception as e:
@@ -0,0 +1,138 @@
+"""
+Shared HTTP session for the data source agents.
+
+Serper, GitHub, HackerNews and YouTube all go through one aiohttp session, so
+they share a single connection pool, DNS cache and SSL context instead of each
+agent holding its own. Agent-specific headers (API keys, auth) are sent per request.
+The rate limiter and TTL result cache the agents use also live here.
+"""
+
+import aiohttp
+import asyncio
+import copy
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+try:
+    import aiodns  # noqa: F401
+    # c-ares resolves on the event loop instead of blocking a threadpool worker per getaddrinfo
+    _RESOLVER_CLASS = aiohttp.AsyncResolver
+except ImportError:
+    _RESOLVER_CLASS = aiohttp.ThreadedResolver
+
+# Upper bound per API call so a hung DNS lookup or connect fails fast instead of stalling a plan
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+
+# Error bodies are only logged; cap what is read so a large HTML error page isn't buffered whole
+_MAX_ERROR_BODY_BYTES = 1024
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get or create the shared aiohttp session"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                resolver=_RESOLVER_CLASS(),
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                # Resolved addresses are shared by every agent and reused for 5 minutes
+                use_dns_cache=True,
+                ttl_dns_cache=300
+            ),
+            timeout=REQUEST_TIMEOUT,
+            headers={"User-Agent": "FaltuAI-Learning-Plan-Agent"}
+        )
+    return _session
+
+
+async def read_error_text(response: aiohttp.ClientResponse) -> str:
+    """Read at most the first KB of an error response body for logging"""
+    body = await response.content.read(_MAX_ERROR_BODY_BYTES)
+    return body.decode("utf-8", errors="replace")
+
+
+async def close_session():
+    """Close the shared aiohttp session"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing `max_rate` acquisitions per `time_period` seconds.
+
+    Callers wait only when the bucket is empty, so slow requests don't pay for
+    pacing they already got, and bursts up to `max_rate` go out immediately.
+    Use as `async with limiter:` around each API call.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, waiting for the bucket to refill if needed"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._last_refill) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class TTLCache:
+    """
+    Bounded cache of API results that expire `ttl_seconds` after being stored.
+
+    Entries are kept in insertion order, so expired entries are always at the
+    front and are dropped before the oldest fresh one when the cache is full.
+    Values are deep-copied in and out so callers can mutate what they get back.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (monotonic timestamp, value)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the fresh value stored for `key`, if any"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return copy.deepcopy(entry[1])
+    
+    def put(self, key: Hashable, value: Any):
+        """Store a copy of `value`, evicting expired entries and then the oldest when full"""
+        now = time.monotonic()
+        # Re-insert at the end so insertion order stays timestamp order
+        self._entries.pop(key, None)
+        while self._entries:
+            oldest_key, (stored_at, _) = next(iter(self._entries.items()))
+            if now - stored_at < self.ttl_seconds and len(self._entries) < self.max_entries:
+                break
+            del self._entries[oldest_key]
+        self._entries[key] = (now, copy.deepcopy(value))
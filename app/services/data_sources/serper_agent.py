@@ -8,16 +8,38 @@ Uses Serper.dev Google Search API to fetch:
 - Learning resource recommendations
 """
 
+import re
+import random
+import hashlib
 import aiohttp
 import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import logging
 import os
-import json
+
+from app.utils.json_utils import loads_json
+from app.services.data_sources.http_client import TTLCache, get_session, read_error_text
 
 logger = logging.getLogger(__name__)
 
+# Phrases marking a search result as a job requirements listing
+_REQUIREMENT_KEYWORDS = (
+    "required", "must have", "experience with", "proficient in",
+    "skills:", "qualifications:", "requirements:", "looking for"
+)
+
+# Search results stay fresh for minutes-to-hours; identical queries inside this window reuse them
+_SEARCH_CACHE_TTL_SECONDS = 15 * 60
+_MAX_CACHED_SEARCHES = 1024
+
+# Transient failures (rate limiting, gateway errors) are retried with jittered exponential backoff
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_SEARCH_ATTEMPTS = 3
+_RETRY_BASE_DELAY_SECONDS = 0.5
+
+_RATING_PATTERN = re.compile(r'(\d+\.?\d*)\s*(?:stars?|rating|★)')
+
 
 class SerperSearchAgent:
     """Agent for conducting real market research using Google Search via Serper API"""
@@ -25,26 +47,19 @@ class SerperSearchAgent:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("SERPER_API_KEY")
         self.base_url = "https://google.serper.dev"
-        self.session: Optional[aiohttp.ClientSession] = None
+        self._headers = {"X-API-KEY": self.api_key or "", "Content-Type": "application/json"}
+        # sha256(normalized request) -> response
+        self._search_cache = TTLCache(_SEARCH_CACHE_TTL_SECONDS, _MAX_CACHED_SEARCHES)
         
         if not self.api_key:
             logger.warning("Serper API key not configured. Real search disabled.")
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "X-API-KEY": self.api_key,
-                    "Content-Type": "application/json"
-                }
-            )
-        return self.session
+        """Get the shared data source session"""
+        return await get_session()
     
     async def close(self):
-        """Close aiohttp session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op: the session is shared by every agent and closed once at app shutdown"""
     
     async def search(
         self, 
@@ -69,6 +84,16 @@ class SerperSearchAgent:
             logger.error("Serper API key not configured")
             return {"organic": [], "error": "API key not configured"}
         
+        # Case and whitespace differences don't change Google's results
+        normalized_query = " ".join(query.lower().split())
+        cache_key = hashlib.sha256(
+            f"{search_type}|{num_results}|{location}|{normalized_query}".encode()
+        ).hexdigest()
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Serper cache hit: {query}")
+            return cached
+        
         endpoint = f"{self.base_url}/{search_type}"
         
         payload = {
@@ -79,21 +104,41 @@ class SerperSearchAgent:
             "location": location
         }
         
-        try:
-            session = await self._get_session()
-            async with session.post(endpoint, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Serper search successful: {query} ({len(data.get('organic', []))} results)")
-                    return data
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Serper API error {response.status}: {error_text}")
-                    return {"organic": [], "error": f"API error: {response.status}"}
+        for attempt in range(1, _MAX_SEARCH_ATTEMPTS + 1):
+            try:
+                session = await self._get_session()
+                async with session.post(endpoint, json=payload, headers=self._headers) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=loads_json)
+                        logger.info(f"Serper search successful: {query} ({len(data.get('organic', []))} results)")
+                        self._search_cache.put(cache_key, data)
+                        return data
+                    
+                    # Retried responses are released unread; only the final error body is logged
+                    if response.status not in _RETRYABLE_STATUSES or attempt == _MAX_SEARCH_ATTEMPTS:
+                        error_text = await read_error_text(response)
+                        logger.error(f"Serper API error {response.status}: {error_text}")
+                        return {"organic": [], "error": f"API error: {response.status}"}
+                    logger.warning(f"Serper API error {response.status} for '{query}', retrying (attempt {attempt})")
                     
-        except Exception as e:
-            logger.error(f"Serper search failed for '{query}': {e}")
-            return {"organic": [], "error": str(e)}
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == _MAX_SEARCH_ATTEMPTS:
+                    logger.error(f"Serper search failed for '{query}': {e}")
+                    return {"organic": [], "error": str(e)}
+                logger.warning(f"Serper search failed for '{query}': {e}, retrying (attempt {attempt})")
+            except Exception as e:
+                logger.error(f"Serper search failed for '{query}': {e}")
+                return {"organic": [], "error": str(e)}
+            
+            # Full jitter keeps concurrent searches from retrying in lockstep
+            await asyncio.sleep(random.uniform(0, _RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)))
+    
+    async def _search_all(self, queries: List[str], **search_kwargs) -> List[Dict[str, Any]]:
+        """
+        Run independent searches concurrently; results come back in query order.
+        search() never raises, so one failed query can't sink the others.
+        """
+        return await asyncio.gather(*(self.search(query, **search_kwargs) for query in queries))
     
     async def research_job_market(
         self, 
@@ -122,11 +167,9 @@ class SerperSearchAgent:
         ]
         
         all_results = []
-        for query in searches:
-            result = await self.search(query, num_results=10, location=location)
+        for result in await self._search_all(searches, num_results=10, location=location):
             if "organic" in result:
                 all_results.extend(result["organic"])
-            await asyncio.sleep(0.5)  # Rate limiting
         
         # Extract insights from search results
         job_requirements = self._extract_job_requirements(all_results)
@@ -169,17 +212,18 @@ class SerperSearchAgent:
         news_results = []
         organic_results = []
         
-        for query in searches[:2]:
-            result = await self.search(query, search_type="search", num_results=10)
+        organic_responses, news_responses = await asyncio.gather(
+            self._search_all(searches[:2], search_type="search", num_results=10),
+            self._search_all(searches[2:], search_type="news", num_results=5)
+        )
+        
+        for result in organic_responses:
             if "organic" in result:
                 organic_results.extend(result["organic"])
-            await asyncio.sleep(0.5)
         
-        for query in searches[2:]:
-            result = await self.search(query, search_type="news", num_results=5)
+        for result in news_responses:
             if "news" in result:
                 news_results.extend(result["news"])
-            await asyncio.sleep(0.5)
         
         return {
             "technology": technology,
@@ -216,11 +260,9 @@ class SerperSearchAgent:
         ]
         
         all_results = []
-        for query in searches:
-            result = await self.search(query, num_results=10)
+        for result in await self._search_all(searches, num_results=10):
             if "organic" in result:
                 all_results.extend(result["organic"])
-            await asyncio.sleep(0.5)
         
         courses = self._extract_courses(all_results, platforms)
         
@@ -254,11 +296,9 @@ class SerperSearchAgent:
         ]
         
         all_results = []
-        for query in searches:
-            result = await self.search(query, num_results=8, location=location)
+        for result in await self._search_all(searches, num_results=8, location=location):
             if "organic" in result:
                 all_results.extend(result["organic"])
-            await asyncio.sleep(0.5)
         
         salary_mentions = self._extract_salary_mentions(all_results)
         
@@ -281,13 +321,11 @@ class SerperSearchAgent:
             title = result.get("title", "")
             link = result.get("link", "")
             
-            # Look for requirement keywords
-            requirement_keywords = [
-                "required", "must have", "experience with", "proficient in",
-                "skills:", "qualifications:", "requirements:", "looking for"
-            ]
+            # Look for requirement keywords (lowercased once per result; the newline
+            # keeps multi-word keywords from matching across snippet and title)
+            text_lc = f"{snippet}\n{title}".lower()
             
-            if any(keyword in snippet.lower() or keyword in title.lower() for keyword in requirement_keywords):
+            if any(keyword in text_lc for keyword in _REQUIREMENT_KEYWORDS):
                 requirements.append({
                     "title": title,
                     "snippet": snippet,
@@ -300,8 +338,6 @@ class SerperSearchAgent:
     
     def _extract_salary_mentions(self, results: List[Dict]) -> List[Dict[str, Any]]:
         """Extract salary mentions from search results with currency detection"""
-        import re
-        
         salary_data = []
         # Patterns for different currencies
         usd_pattern = r'\$[\d,]+(?:k|K)?(?:\s*-\s*\$[\d,]+(?:k|K)?)?'
@@ -358,8 +394,6 @@ class SerperSearchAgent:
     
     def _extract_skills(self, results: List[Dict], skill_area: str) -> List[str]:
         """Extract mentioned skills from search results"""
-        import re
-        
         # Common tech skills patterns
         tech_keywords = [
             "python", "javascript", "react", "node", "docker", "kubernetes", "aws", "azure",
@@ -392,13 +426,13 @@ class SerperSearchAgent:
             snippet = result.get("snippet", "")
             link = result.get("link", "")
             source = result.get("displayLink", "").lower()
+            link_lc = link.lower()
             
             # Check if it's from a learning platform
-            if any(platform in source or platform in link.lower() for platform in platforms):
+            if any(platform in source or platform in link_lc for platform in platforms):
                 # Extract rating if mentioned
                 rating = None
-                import re
-                rating_match = re.search(r'(\d+\.?\d*)\s*(?:stars?|rating|★)', snippet.lower())
+                rating_match = _RATING_PATTERN.search(snippet.lower())
                 if rating_match:
                     rating = float(rating_match.group(1))
                 
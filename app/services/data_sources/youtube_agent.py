@@ -14,8 +14,24 @@ from datetime import datetime
 import logging
 import os
 
+from app.utils.json_utils import loads_json
+from app.services.data_sources.http_client import TTLCache, get_session, read_error_text
+
 logger = logging.getLogger(__name__)
 
+# Each search.list call costs 100 units of the 10k/day quota; repeated searches reuse results
+_SEARCH_CACHE_TTL_SECONDS = 60 * 60
+_MAX_CACHED_SEARCHES = 256
+
+# Partial-response masks: request only the fields the ranking/stats code reads,
+# which cuts the payload several-fold (full snippets carry every thumbnail size, etags, etc.)
+_VIDEO_SEARCH_FIELDS = "items(id/videoId,snippet(title,description,channelTitle,publishedAt,thumbnails/high/url))"
+_VIDEO_STATS_FIELDS = "items(id,statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+_CHANNEL_SEARCH_FIELDS = "items(id/channelId,snippet(title,thumbnails/high/url))"
+_CHANNEL_STATS_FIELDS = "items(id,statistics(subscriberCount,videoCount,viewCount),snippet/description)"
+_PLAYLIST_SEARCH_FIELDS = "items(id/playlistId,snippet(title,description,channelTitle,thumbnails))"
+_PLAYLIST_DETAILS_FIELDS = "items(id,contentDetails/itemCount)"
+
 
 class YouTubeResourceAgent:
     """Agent for discovering learning resources on YouTube"""
@@ -23,21 +39,18 @@ class YouTubeResourceAgent:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("YOUTUBE_API_KEY")
         self.base_url = "https://www.googleapis.com/youtube/v3"
-        self.session: Optional[aiohttp.ClientSession] = None
+        # (search type, normalized query, *options) -> enriched items
+        self._search_cache = TTLCache(_SEARCH_CACHE_TTL_SECONDS, _MAX_CACHED_SEARCHES)
         
         if not self.api_key:
             logger.warning("YouTube API key not configured. Video search disabled.")
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
+        """Get the shared data source session"""
+        return await get_session()
     
     async def close(self):
-        """Close aiohttp session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op: the session is shared by every agent and closed once at app shutdown"""
     
     async def search_videos(
         self,
@@ -59,6 +72,12 @@ class YouTubeResourceAgent:
             logger.error("YouTube API key not configured")
             return []
         
+        cache_key = ("video", " ".join(query.lower().split()), max_results, order, video_duration)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"YouTube cache hit: {query}")
+            return cached
+        
         endpoint = f"{self.base_url}/search"
         params = {
             "part": "snippet",
@@ -67,6 +86,7 @@ class YouTubeResourceAgent:
             "maxResults": min(max_results, 50),
             "order": order,
             "videoDuration": video_duration,
+            "fields": _VIDEO_SEARCH_FIELDS,
             "key": self.api_key
         }
         
@@ -74,7 +94,7 @@ class YouTubeResourceAgent:
             session = await self._get_session()
             async with session.get(endpoint, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     items = data.get("items", [])
                     logger.info(f"Found {len(items)} videos for '{query}'")
                     
@@ -89,9 +109,10 @@ class YouTubeResourceAgent:
                         item["statistics"] = stats.get(video_id, {})
                         enriched_items.append(item)
                     
+                    self._search_cache.put(cache_key, enriched_items)
                     return enriched_items
                 else:
-                    error_text = await response.text()
+                    error_text = await read_error_text(response)
                     logger.error(f"YouTube API error {response.status}: {error_text}")
                     return []
         except Exception as e:
@@ -107,6 +128,7 @@ class YouTubeResourceAgent:
         params = {
             "part": "statistics,contentDetails",
             "id": ",".join(video_ids),
+            "fields": _VIDEO_STATS_FIELDS,
             "key": self.api_key
         }
         
@@ -114,15 +136,16 @@ class YouTubeResourceAgent:
             session = await self._get_session()
             async with session.get(endpoint, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     
                     stats_map = {}
                     for item in data.get("items", []):
                         video_id = item.get("id")
+                        statistics = item.get("statistics", {})
                         stats_map[video_id] = {
-                            "view_count": int(item.get("statistics", {}).get("viewCount", 0)),
-                            "like_count": int(item.get("statistics", {}).get("likeCount", 0)),
-                            "comment_count": int(item.get("statistics", {}).get("commentCount", 0)),
+                            "view_count": int(statistics.get("viewCount", 0)),
+                            "like_count": int(statistics.get("likeCount", 0)),
+                            "comment_count": int(statistics.get("commentCount", 0)),
                             "duration": item.get("contentDetails", {}).get("duration", "")
                         }
                     
@@ -141,12 +164,19 @@ class YouTubeResourceAgent:
         if not self.api_key:
             return []
         
+        cache_key = ("channel", " ".join(query.lower().split()), max_results)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"YouTube cache hit: {query}")
+            return cached
+        
         endpoint = f"{self.base_url}/search"
         params = {
             "part": "snippet",
             "q": query,
             "type": "channel",
             "maxResults": min(max_results, 50),
+            "fields": _CHANNEL_SEARCH_FIELDS,
             "key": self.api_key
         }
         
@@ -154,7 +184,7 @@ class YouTubeResourceAgent:
             session = await self._get_session()
             async with session.get(endpoint, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     items = data.get("items", [])
                     
                     # Get channel statistics
@@ -166,6 +196,7 @@ class YouTubeResourceAgent:
                         channel_id = item["id"]["channelId"]
                         item["statistics"] = stats.get(channel_id, {})
                     
+                    self._search_cache.put(cache_key, items)
                     return items
                 else:
                     logger.error(f"YouTube channel search failed: {response.status}")
@@ -183,6 +214,7 @@ class YouTubeResourceAgent:
         params = {
             "part": "statistics,snippet",
             "id": ",".join(channel_ids),
+            "fields": _CHANNEL_STATS_FIELDS,
             "key": self.api_key
         }
         
@@ -190,15 +222,16 @@ class YouTubeResourceAgent:
             session = await self._get_session()
             async with session.get(endpoint, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     
                     stats_map = {}
                     for item in data.get("items", []):
                         channel_id = item.get("id")
+                        statistics = item.get("statistics", {})
                         stats_map[channel_id] = {
-                            "subscriber_count": int(item.get("statistics", {}).get("subscriberCount", 0)),
-                            "video_count": int(item.get("statistics", {}).get("videoCount", 0)),
-                            "view_count": int(item.get("statistics", {}).get("viewCount", 0)),
+                            "subscriber_count": int(statistics.get("subscriberCount", 0)),
+                            "video_count": int(statistics.get("videoCount", 0)),
+                            "view_count": int(statistics.get("viewCount", 0)),
                             "description": item.get("snippet", {}).get("description", "")
                         }
                     
@@ -240,11 +273,11 @@ class YouTubeResourceAgent:
         
         query = content_queries.get(content_type, content_queries["tutorial"])
         
-        # Search for videos
-        videos = await self.search_videos(query, max_results=20, order="relevance")
-        
-        # Search for educational channels
-        channels = await self.search_channels(f"{topic} programming tutorial", max_results=10)
+        # Video and channel searches are independent; run them concurrently over the shared session
+        videos, channels = await asyncio.gather(
+            self.search_videos(query, max_results=20, order="relevance"),
+            self.search_channels(f"{topic} programming tutorial", max_results=10)
+        )
         
         # Parse and rank results
         top_videos = self._rank_educational_videos(videos)
@@ -280,6 +313,7 @@ class YouTubeResourceAgent:
             "q": f"{topic} complete course playlist",
             "type": "playlist",
             "maxResults": 20,
+            "fields": _PLAYLIST_SEARCH_FIELDS,
             "key": self.api_key
         }
         
@@ -287,16 +321,18 @@ class YouTubeResourceAgent:
             session = await self._get_session()
             async with session.get(endpoint, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
+                    items = data.get("items", [])
                     playlists = []
                     
-                    for item in data.get("items", []):
+                    # Get details for every playlist in one batched request
+                    details = await self._get_playlist_details([item["id"]["playlistId"] for item in items])
+                    
+                    for item in items:
                         playlist_id = item["id"]["playlistId"]
                         snippet = item.get("snippet", {})
                         
-                        # Get playlist details
-                        playlist_info = await self._get_playlist_details(playlist_id)
-                        
+                        playlist_info = details.get(playlist_id)
                         if playlist_info and playlist_info.get("video_count", 0) >= min_videos:
                             playlists.append({
                                 "title": snippet.get("title"),
@@ -307,8 +343,6 @@ class YouTubeResourceAgent:
                                 "video_count": playlist_info.get("video_count"),
                                 "thumbnails": snippet.get("thumbnails", {})
                             })
-                        
-                        await asyncio.sleep(0.2)  # Rate limiting
                     
                     return playlists
         except Exception as e:
@@ -316,12 +350,17 @@ class YouTubeResourceAgent:
         
         return []
     
-    async def _get_playlist_details(self, playlist_id: str) -> Optional[Dict]:
-        """Get details about a playlist"""
+    async def _get_playlist_details(self, playlist_ids: List[str]) -> Dict[str, Dict]:
+        """Get details for multiple playlists (the API accepts up to 50 ids per call)"""
+        if not playlist_ids:
+            return {}
+        
         endpoint = f"{self.base_url}/playlists"
         params = {
             "part": "contentDetails",
-            "id": playlist_id,
+            "id": ",".join(playlist_ids),
+            "maxResults": min(len(playlist_ids), 50),
+            "fields": _PLAYLIST_DETAILS_FIELDS,
             "key": self.api_key
         }
         
@@ -329,16 +368,17 @@ class YouTubeResourceAgent:
             session = await self._get_session()
             async with session.get(endpoint, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    items = data.get("items", [])
-                    if items:
-                        return {
-                            "video_count": items[0].get("contentDetails", {}).get("itemCount", 0)
+                    data = await response.json(loads=loads_json)
+                    return {
+                        item.get("id"): {
+                            "video_count": item.get("contentDetails", {}).get("itemCount", 0)
                         }
+                        for item in data.get("items", [])
+                    }
         except Exception as e:
             logger.error(f"Failed to fetch playlist details: {e}")
         
-        return None
+        return {}
     
     def _rank_educational_videos(self, videos: List[Dict]) -> List[Dict[str, Any]]:
         """Rank videos by educational value (views, engagement, recency)"""
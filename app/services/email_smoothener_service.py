@@ -7,7 +7,6 @@ from typing import TypedDict, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, START, END
-from langsmith import Client
 
 from app.config import settings
 from app.schemas.email_smoothener import EmailDraftAssessment, EmailSmoothenerResponse
@@ -29,13 +28,6 @@ class EmailSmoothenerService:
             os.environ["LANGCHAIN_API_KEY"] = settings.LANGCHAIN_API_KEY or ""
             os.environ["LANGCHAIN_PROJECT"] = settings.LANGCHAIN_PROJECT or "faltuai-fun"
 
-        self.langsmith_client = None
-        try:
-            self.langsmith_client = Client()
-            logger.info("LangSmith client initialized for EmailSmoothenerService")
-        except Exception as exc:
-            logger.warning(f"LangSmith client initialization failed: {exc}")
-
         self.llm = ChatOpenAI(
             openai_api_key=settings.OPENAI_API_KEY,
             model=settings.OPENAI_MODEL,
@@ -43,7 +35,15 @@ class EmailSmoothenerService:
         )
 
         self.prompt_path = Path(__file__).resolve().parents[1] / "prompts" / "esm_email_smoothener.md"
-        self.graph = self._build_graph()
+        self._chain = None
+        self._graph = None
+
+    @property
+    def graph(self):
+        # Workflow is compiled on first use so importing the service stays cheap
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
 
     def _load_system_prompt(self) -> str:
         if not self.prompt_path.exists():
@@ -51,6 +51,23 @@ class EmailSmoothenerService:
 
         return self.prompt_path.read_text(encoding="utf-8").strip()
 
+    def _get_chain(self):
+        # Prompt file is read and the prompt/structured-output chain compiled once, on first use
+        if self._chain is None:
+            system_prompt = self._load_system_prompt()
+            prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", system_prompt),
+                    (
+                        "human",
+                        "Raw draft:\n\n{raw_text}\n\nReturn exactly three variants with style keys: corporate_robot, kind_but_firm, no_nonsense. Also provide draft_assessment fields requested by schema.",
+                    ),
+                ]
+            )
+
+            self._chain = prompt | self.llm.with_structured_output(EmailSmoothenerResponse)
+        return self._chain
+
     def _build_graph(self):
         workflow = StateGraph(EmailSmoothenerState)
         workflow.add_node("smoothen_email", self._smoothen_email_node)
@@ -204,18 +221,7 @@ class EmailSmoothenerService:
 
     async def _smoothen_email_node(self, state: EmailSmoothenerState) -> EmailSmoothenerState:
         try:
-            system_prompt = self._load_system_prompt()
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", system_prompt),
-                    (
-                        "human",
-                        "Raw draft:\n\n{raw_text}\n\nReturn exactly three variants with style keys: corporate_robot, kind_but_firm, no_nonsense. Also provide draft_assessment fields requested by schema.",
-                    ),
-                ]
-            )
-
-            chain = prompt | self.llm.with_structured_output(EmailSmoothenerResponse)
+            chain = self._get_chain()
             result = await chain.ainvoke(
                 {"raw_text": state["raw_text"]},
                 config={"run_name": "esm_email_smoothener", "tags": ["email-smoothener", "langgraph"]},
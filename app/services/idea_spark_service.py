@@ -4,7 +4,6 @@ from pathlib import Path
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from langsmith import Client
 
 from app.config import settings
 from app.schemas.idea_spark import IdeaSparkRequest
@@ -21,13 +20,6 @@ class IdeaSparkService:
             os.environ["LANGCHAIN_API_KEY"] = settings.LANGCHAIN_API_KEY or ""
             os.environ["LANGCHAIN_PROJECT"] = settings.LANGCHAIN_PROJECT or "faltuai-fun"
 
-        self.langsmith_client = None
-        try:
-            self.langsmith_client = Client()
-            logger.info("LangSmith client initialized for IdeaSparkService")
-        except Exception as exc:
-            logger.warning(f"LangSmith client initialization failed: {exc}")
-
         self.llm = ChatOpenAI(
             openai_api_key=settings.OPENAI_API_KEY,
             model=settings.OPENAI_MODEL,
@@ -35,6 +27,7 @@ class IdeaSparkService:
         )
 
         self.prompt_path = Path(__file__).resolve().parents[1] / "prompts" / "idea_spark.md"
+        self._chain = None
 
     def _load_system_prompt(self) -> str:
         if not self.prompt_path.exists():
@@ -42,32 +35,38 @@ class IdeaSparkService:
 
         return self.prompt_path.read_text(encoding="utf-8").strip()
 
+    def _get_chain(self):
+        # Prompt file is read and the prompt/structured-output chain compiled once, on first use
+        if self._chain is None:
+            system_prompt = self._load_system_prompt()
+
+            prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", system_prompt),
+                    (
+                        "human",
+                        (
+                            "Generate 10 practical micro-ideas using this context:\n"
+                            "Phrase: {phrase}\n"
+                            "Time Available: {time_available}\n"
+                            "What to Create: {create_type}\n"
+                            "Skill Area: {skill_area}\n"
+                            "Difficulty Level: {difficulty_level}"
+                        ),
+                    ),
+                ]
+            )
+
+            self._chain = prompt | self.llm.with_structured_output(IdeaSparkResponse)
+        return self._chain
+
     async def spark_ideas(self, request: IdeaSparkRequest) -> IdeaSparkResponse:
         normalized_phrase = (request.phrase or "").strip()
 
         if len(normalized_phrase) < 2:
             raise ValueError("Please enter at least 2 characters.")
 
-        system_prompt = self._load_system_prompt()
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_prompt),
-                (
-                    "human",
-                    (
-                        "Generate 10 practical micro-ideas using this context:\n"
-                        "Phrase: {phrase}\n"
-                        "Time Available: {time_available}\n"
-                        "What to Create: {create_type}\n"
-                        "Skill Area: {skill_area}\n"
-                        "Difficulty Level: {difficulty_level}"
-                    ),
-                ),
-            ]
-        )
-
-        chain = prompt | self.llm.with_structured_output(IdeaSparkResponse)
+        chain = self._get_chain()
 
         result = await chain.ainvoke(
             {
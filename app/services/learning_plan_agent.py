@@ -6,8 +6,11 @@ comprehensive, personalized learning plans with real-world market research.
 """
 
 import json
+import copy
+import time
 import asyncio
-from typing import TypedDict, List, Dict, Any, Annotated
+from operator import itemgetter
+from typing import TypedDict, List, Dict, Any, Annotated, Tuple
 from datetime import datetime
 import logging
 
@@ -25,11 +28,34 @@ from app.schemas.skill_assessment import (
     LearningResource,
     ProjectIdea,
     MarketTrend,
-    DifficultyLevel
+    DifficultyLevel,
+    DIFFICULTY_ALIASES
 )
 
 logger = logging.getLogger(__name__)
 
+# Raw difficulty string -> stored enum value, resolved once at import
+_DIFFICULTY_VALUES = {alias: level.value for alias, level in DIFFICULTY_ALIASES.items()}
+
+# Field extractors used when assembling the final plan; items are merged over
+# the defaults first so a single itemgetter call replaces a chain of .get()s
+_RESOURCE_DEFAULTS = {
+    'title': '', 'type': 'course', 'url_pattern': '#', 'cost': 'Free',
+    'difficulty': 'intermediate', 'estimated_hours': 10
+}
+_RESOURCE_FIELDS = itemgetter('title', 'type', 'url_pattern', 'cost', 'difficulty', 'estimated_hours')
+
+_PROJECT_DEFAULTS = {
+    'title': '', 'description': '', 'difficulty': 'intermediate',
+    'duration_weeks': 2, 'technologies': [], 'skills_practiced': []
+}
+# Market research depends only on topic/level and changes on the order of hours,
+# so the research node's output is reused across plans within this window
+_MARKET_RESEARCH_TTL_SECONDS = 6 * 60 * 60
+_MAX_CACHED_MARKET_RESEARCH = 128
+
+_PROJECT_FIELDS = itemgetter('title', 'description', 'difficulty', 'duration_weeks', 'technologies', 'skills_practiced')
+
 
 class LearningPlanState(TypedDict):
     """State for learning plan generation workflow"""
@@ -77,7 +103,16 @@ class LearningPlanAgent:
     
     def __init__(self):
         self.market_agent = market_research_agent
-        self.graph = self._build_workflow()
+        # (topic, experience_level) -> (monotonic timestamp, research result)
+        self._market_research_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._graph = None
+    
+    @property
+    def graph(self):
+        """Compiled workflow, built on first use so importing the agent stays cheap"""
+        if self._graph is None:
+            self._graph = self._build_workflow()
+        return self._graph
     
     def _build_workflow(self) -> StateGraph:
         """Build the LangGraph workflow for learning plan generation"""
@@ -98,9 +133,11 @@ class LearningPlanAgent:
         workflow.add_edge("research_market", "analyze_gaps")
         workflow.add_edge("analyze_gaps", "define_objectives")
         workflow.add_edge("define_objectives", "design_curriculum")
+        # Resource curation and project generation only depend on the curriculum,
+        # so they run as parallel branches and join before timeline planning
         workflow.add_edge("design_curriculum", "curate_resources")
-        workflow.add_edge("curate_resources", "generate_projects")
-        workflow.add_edge("generate_projects", "plan_timeline")
+        workflow.add_edge("design_curriculum", "generate_projects")
+        workflow.add_edge(["curate_resources", "generate_projects"], "plan_timeline")
         workflow.add_edge("plan_timeline", "assemble_plan")
         workflow.add_edge("assemble_plan", END)
         
@@ -120,10 +157,7 @@ class LearningPlanAgent:
         
         try:
             # Use existing market research agent
-            research_result = await self.market_agent.research_market_trends(
-                topic=state['topic'],
-                experience_level=state['experience_level']
-            )
+            research_result = await self._cached_market_research(state['topic'], state['experience_level'])
             
             state['market_research'] = research_result
             
@@ -141,6 +175,30 @@ class LearningPlanAgent:
         
         return state
     
+    async def _cached_market_research(self, topic: str, experience_level: str) -> Dict[str, Any]:
+        """Market research for topic/level, served from the node cache while fresh"""
+        key = (topic.lower(), experience_level)
+        now = time.monotonic()
+        
+        cached = self._market_research_cache.get(key)
+        if cached is not None and now - cached[0] < _MARKET_RESEARCH_TTL_SECONDS:
+            logger.info(f"Reusing cached market research for {topic} ({experience_level})")
+            # Copy so downstream nodes can't mutate the cached result
+            return copy.deepcopy(cached[1])
+        
+        research_result = await self.market_agent.research_market_trends(
+            topic=topic,
+            experience_level=experience_level
+        )
+        
+        if len(self._market_research_cache) >= _MAX_CACHED_MARKET_RESEARCH:
+            # Evict the oldest entry
+            oldest_key = min(self._market_research_cache, key=lambda k: self._market_research_cache[k][0])
+            del self._market_research_cache[oldest_key]
+        self._market_research_cache[key] = (now, copy.deepcopy(research_result))
+        
+        return research_result
+    
     async def _skill_gap_analysis_node(self, state: LearningPlanState) -> LearningPlanState:
         """Node 2: Analyze skill gaps based on assessment and market data"""
         logger.info("Analyzing skill gaps")
@@ -397,13 +455,12 @@ Return as JSON:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = await llm_service.generate_structured_response(
+                modules = await self._stream_curriculum_modules(
                     prompt=prompt,
-                    schema_description="JSON with modules array containing detailed curriculum structure",
-                    temperature=0.7 - (attempt * 0.1)  # Reduce temperature on retries
+                    temperature=0.7 - (attempt * 0.1),  # Reduce temperature on retries
+                    progress_callback=state.get('progress_callback')
                 )
                 
-                modules = response.get('modules', [])
                 if modules:  # Only accept if we got modules
                     state['learning_modules'] = modules
                     logger.info(f"Created {len(state['learning_modules'])} learning modules")
@@ -419,7 +476,33 @@ Return as JSON:
         
         return state
     
-    async def _resource_curation_node(self, state: LearningPlanState) -> LearningPlanState:
+    async def _stream_curriculum_modules(
+        self,
+        prompt: str,
+        temperature: float,
+        progress_callback=None
+    ) -> List[Dict[str, Any]]:
+        """Stream curriculum modules, emitting a progress update as each one completes"""
+        modules = []
+        
+        async for module in llm_service.stream_json_array_items(
+            prompt=prompt,
+            schema_description="JSON with modules array containing detailed curriculum structure",
+            array_key="modules",
+            temperature=temperature
+        ):
+            modules.append(module)
+            
+            if progress_callback:
+                await progress_callback({
+                    'stage': 'curriculum',
+                    'message': f"📚 Drafted module {len(modules)}: {module.get('title', 'Untitled')}",
+                    'progress': min(55 + len(modules) * 2, 68)
+                })
+        
+        return modules
+    
+    async def _resource_curation_node(self, state: LearningPlanState) -> Dict[str, Any]:
         """Node 5: Curate specific learning resources for each module"""
         logger.info("Curating learning resources")
         
@@ -431,15 +514,26 @@ Return as JSON:
                 'progress': 70
             })
         
-        all_resources = []
+        # Modules are curated independently, so issue all LLM calls concurrently
+        module_resources = await asyncio.gather(*(
+            self._curate_module_resources(module, state['experience_level'])
+            for module in state['learning_modules']
+        ))
+        all_resources = [res for resources in module_resources for res in resources]
         
-        for module in state['learning_modules']:
-            prompt = f"""
+        logger.info(f"Curated {len(all_resources)} learning resources")
+        
+        # Parallel branch: return only the key this node owns
+        return {'resources': all_resources}
+    
+    async def _curate_module_resources(self, module: Dict[str, Any], experience_level: str) -> List[Dict[str, Any]]:
+        """Curate resources for a single module; failures yield no resources for that module"""
+        prompt = f"""
 You are a learning resource curator finding the best online resources for {current_period['quarter_full']}.
 
 Module: {module.get('title', '')}
 Topics: {', '.join(module.get('topics', []))}
-Level: {state['experience_level']}
+Level: {experience_level}
 
 Find 3-5 high-quality resources for this module:
 1. Include mix of courses, tutorials, documentation, videos
@@ -464,28 +558,24 @@ Return as JSON:
     ]
 }}
 """
-            
-            try:
-                response = await llm_service.generate_structured_response(
-                    prompt=prompt,
-                    schema_description="JSON with resources array",
-                    temperature=0.6
-                )
-                
-                module_resources = response.get('resources', [])
-                for res in module_resources:
-                    res['module_title'] = module.get('title', '')
-                all_resources.extend(module_resources)
-                
-            except Exception as e:
-                logger.error(f"Resource curation failed for module {module.get('title')}: {e}")
         
-        state['resources'] = all_resources
-        logger.info(f"Curated {len(all_resources)} learning resources")
-        
-        return state
+        try:
+            response = await llm_service.generate_structured_response(
+                prompt=prompt,
+                schema_description="JSON with resources array",
+                temperature=0.6
+            )
+            
+            module_resources = response.get('resources', [])
+            for res in module_resources:
+                res['module_title'] = module.get('title', '')
+            return module_resources
+            
+        except Exception as e:
+            logger.error(f"Resource curation failed for module {module.get('title')}: {e}")
+            return []
     
-    async def _project_generation_node(self, state: LearningPlanState) -> LearningPlanState:
+    async def _project_generation_node(self, state: LearningPlanState) -> Dict[str, Any]:
         """Node 6: Generate hands-on project ideas"""
         logger.info("Generating project ideas")
         
@@ -506,6 +596,10 @@ Return as JSON:
         ]
         student_strengths = state.get('strengths', [])[:5]
         
+        # Looked up once; an empty hiring_trends list falls back instead of raising IndexError
+        market_insights = state.get('market_insights')
+        hiring_trend = (market_insights.get('hiring_trends') or ['modern web apps'])[0] if market_insights else 'modern development'
+        
         prompt = f"""
 You are a technical mentor designing HIGHLY DETAILED practical projects for a {state['experience_level']} {state['topic']} developer.
 
@@ -526,7 +620,7 @@ Create 4-6 progressively challenging project ideas that:
 3. Can be completed in 1-2 weeks each with clear milestones
 4. Build a strong portfolio that demonstrates job-ready skills
 5. Use modern {current_period['quarter_full']} technologies and best practices (be specific: React 19, Next.js 15, etc.)
-6. Are relevant to current hiring trends: {state.get('market_insights', {}).get('hiring_trends', ['modern web apps'])[0] if state.get('market_insights') else 'modern development'}
+6. Are relevant to current hiring trends: {hiring_trend}
 
 For each project:
 - Description: 4-6 detailed sentences explaining architecture, problem-solving approach, and technical implementation
@@ -569,7 +663,8 @@ Return as JSON:
             logger.error(f"Project generation failed: {e}")
             state['project_ideas'] = []
         
-        return state
+        # Parallel branch: return only the key this node owns
+        return {'project_ideas': state['project_ideas']}
     
     async def _timeline_planning_node(self, state: LearningPlanState) -> LearningPlanState:
         """Node 7: Create detailed weekly timeline"""
@@ -611,32 +706,28 @@ Return as JSON:
         
         try:
             # Convert to final schema format
+            # Group resources by module once instead of rescanning them for every module
+            resources_by_module: Dict[Any, List[Dict[str, Any]]] = {}
+            for res in state['resources']:
+                resources_by_module.setdefault(res.get('module_title'), []).append(res)
+            
             learning_modules = []
             for mod_data in state['learning_modules']:
                 # Find resources for this module
-                module_resources = [
-                    res for res in state['resources']
-                    if res.get('module_title') == mod_data.get('title')
-                ]
+                module_resources = resources_by_module.get(mod_data.get('title'), [])
                 
                 # Convert to LearningResource schema
                 resources = []
                 for res in module_resources[:4]:  # Limit to 4 resources per module
-                    difficulty_map = {
-                        'beginner': DifficultyLevel.EASY,
-                        'intermediate': DifficultyLevel.MEDIUM,
-                        'advanced': DifficultyLevel.HARD
-                    }
-                    
-                    resource = {
-                        'title': res.get('title', ''),
-                        'type': res.get('type', 'course'),
-                        'url': res.get('url_pattern', '#'),
-                        'cost': res.get('cost', 'Free'),
-                        'difficulty': difficulty_map.get(res.get('difficulty', 'intermediate'), DifficultyLevel.MEDIUM).value,
-                        'estimated_hours': res.get('estimated_hours', 10)
-                    }
-                    resources.append(resource)
+                    title, res_type, url, cost, difficulty, hours = _RESOURCE_FIELDS({**_RESOURCE_DEFAULTS, **res})
+                    resources.append({
+                        'title': title,
+                        'type': res_type,
+                        'url': url,
+                        'cost': cost,
+                        'difficulty': _DIFFICULTY_VALUES.get(difficulty, DifficultyLevel.MEDIUM.value),
+                        'estimated_hours': hours
+                    })
                 
                 module = {
                     'title': mod_data.get('title', ''),
@@ -651,21 +742,15 @@ Return as JSON:
             # Convert project ideas
             project_ideas = []
             for proj in state['project_ideas']:
-                difficulty_map = {
-                    'beginner': DifficultyLevel.EASY,
-                    'intermediate': DifficultyLevel.MEDIUM,
-                    'advanced': DifficultyLevel.HARD
-                }
-                
-                project = {
-                    'title': proj.get('title', ''),
-                    'description': proj.get('description', ''),
-                    'difficulty': difficulty_map.get(proj.get('difficulty', 'intermediate'), DifficultyLevel.MEDIUM).value,
-                    'duration_weeks': proj.get('duration_weeks', 2),
-                    'technologies': proj.get('technologies', []),
-                    'learning_objectives': proj.get('skills_practiced', [])
-                }
-                project_ideas.append(project)
+                title, description, difficulty, weeks, technologies, skills = _PROJECT_FIELDS({**_PROJECT_DEFAULTS, **proj})
+                project_ideas.append({
+                    'title': title,
+                    'description': description,
+                    'difficulty': _DIFFICULTY_VALUES.get(difficulty, DifficultyLevel.MEDIUM.value),
+                    'duration_weeks': weeks,
+                    'technologies': technologies,
+                    'learning_objectives': skills
+                })
             
             # Extract market trends from research
             market_trends = []
@@ -689,7 +774,12 @@ Return as JSON:
                 'priority_skills': state['priority_skills'],
                 'project_ideas': project_ideas,
                 'market_trends': market_trends,
-                'learning_resources': state['resources'],
+                # Curated resources are raw LLM output; fill missing keys (url falls back to '#')
+                # so one incomplete entry doesn't fail validation of the whole plan
+                'learning_resources': [
+                    {**_RESOURCE_DEFAULTS, 'url_pattern': res.get('url', '#'), **res}
+                    for res in state['resources']
+                ],
                 'market_research_insights': state.get('market_research', {})
             }
             
@@ -761,6 +851,46 @@ Return as JSON:
             logger.error(f"Learning plan generation failed: {e}")
             return self._get_fallback_plan(topic, experience_level)
     
+    async def warmup(self) -> Dict[str, Any]:
+        """
+        Run the non-LLM stages (timeline planning and final assembly) on a small
+        fixture so their first real invocation doesn't pay one-time setup cost.
+        
+        Returns:
+            The assembled fixture plan, for callers that want to warm their own conversion
+        """
+        fixture_module = {
+            'title': 'Warmup Module',
+            'description': 'Warmup',
+            'duration_weeks': 1,
+            'topics': ['Warmup'],
+            'learning_outcomes': ['Warmup']
+        }
+        state = LearningPlanState(
+            topic="warmup",
+            experience_level="beginner",
+            strengths=[],
+            weaknesses=[],
+            overall_score=0,
+            market_research={'market_insights': {'emerging_technologies': ['Warmup']}},
+            skill_gaps=[],
+            trending_technologies=[],
+            learning_objectives=[],
+            timeline_weeks=1,
+            priority_skills=[],
+            learning_modules=[fixture_module],
+            project_ideas=[{'title': 'Warmup Project', 'difficulty': 'beginner'}],
+            resources=[{'title': 'Warmup Resource', 'module_title': 'Warmup Module', 'difficulty': 'beginner'}],
+            learning_plan={},
+            error="",
+            progress_callback=None
+        )
+        # Compile the workflow here rather than on the first user request
+        _ = self.graph
+        state = await self._timeline_planning_node(state)
+        state = await self._final_assembly_node(state)
+        return state['learning_plan']
+    
     def _get_fallback_plan(self, topic: str, experience_level: str) -> Dict[str, Any]:
         """Generate minimal fallback plan if main workflow fails"""
         return {
@@ -4,7 +4,9 @@ Provides REAL market research capabilities using APIs instead of LLM hallucinati
 """
 import json
 import asyncio
-from typing import Dict, Any, List, Optional
+import copy
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from app.services.common import llm_service
 from app.services.data_sources.serper_agent import serper_agent
@@ -15,6 +17,37 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# A full research run costs ~15 API calls plus LLM synthesis; plans for the same topic
+# and level generated shortly after each other reuse the aggregate result
+_RESEARCH_CACHE_TTL_SECONDS = 10 * 60
+_MAX_CACHED_RESEARCH = 64
+
+# Salary mentions passed to the career path prompt; the full list is still returned as real_salary_data
+_MAX_SALARY_MENTIONS_IN_PROMPT = 20
+
+
+def _compact_salary_data(salary_data: Dict[str, Any]) -> str:
+    """
+    Reduce raw Serper salary results to the figures the LLM needs (amounts,
+    currency, location, source) as compact JSON, dropping URLs, titles and
+    snippets that only inflate the prompt
+    """
+    mentions = [
+        {
+            "salary_mention": mention.get("salary_mention", []),
+            "currency": mention.get("currency", ""),
+            "location": mention.get("location", ""),
+            "source": mention.get("source", "")
+        }
+        for mention in salary_data.get("salary_data", [])[:_MAX_SALARY_MENTIONS_IN_PROMPT]
+    ]
+    return json.dumps(
+        {"salary_data": mentions, "sources_count": salary_data.get("sources_count", 0)},
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+
+
 class MarketResearchAgent:
     """
     Agent for conducting REAL market trends research using multiple data sources
@@ -33,6 +66,10 @@ class MarketResearchAgent:
         self.github = github_trends_agent
         self.hackernews = hackernews_agent
         self.youtube = youtube_agent
+        # (topic, experience_level, time_horizon) -> (monotonic timestamp, research result)
+        self._research_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+        # Research runs in flight, shared by concurrent requests for the same topic and level
+        self._inflight_research: Dict[Tuple[str, str, str], asyncio.Task] = {}
     
     async def research_market_trends(
         self, 
@@ -50,6 +87,29 @@ class MarketResearchAgent:
         4. YouTube API: Available learning resources
         5. LLM: Synthesizes real data into actionable insights
         """
+        cache_key = (topic.strip().lower(), experience_level.strip().lower(), time_horizon)
+        cached = self._research_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _RESEARCH_CACHE_TTL_SECONDS:
+            logger.info(f"Market research cache hit for {topic} at {experience_level} level")
+            return copy.deepcopy(cached[1])
+        
+        research = self._inflight_research.get(cache_key)
+        if research is None:
+            research = asyncio.create_task(self._run_market_research(cache_key, topic, experience_level, time_horizon))
+            self._inflight_research[cache_key] = research
+            research.add_done_callback(lambda _: self._inflight_research.pop(cache_key, None))
+        
+        # Shield so one cancelled request does not cancel the research for the others
+        return copy.deepcopy(await asyncio.shield(research))
+    
+    async def _run_market_research(
+        self,
+        cache_key: Tuple[str, str, str],
+        topic: str,
+        experience_level: str,
+        time_horizon: str
+    ) -> Dict[str, Any]:
+        """Gather and synthesize all research sources, caching a complete result"""
         logger.info(f"Starting REAL market research for {topic} at {experience_level} level")
         
         # Execute all research tasks in parallel for efficiency
@@ -76,7 +136,7 @@ class MarketResearchAgent:
             learning_resources, tech_trends, topic
         )
         
-        return {
+        research = {
             "market_demand": demand_research,
             "skill_gaps": skills_analysis,
             "career_paths": career_research,
@@ -87,6 +147,15 @@ class MarketResearchAgent:
             "research_version": "real_data_v1",
             "data_sources": ["Serper API", "GitHub API", "HackerNews API", "YouTube API"]
         }
+        
+        # Only cache complete runs so a transient failure isn't served for the whole TTL;
+        # failed steps come back as {} (career paths is also {} when no salary data exists)
+        if all((demand_research, skills_analysis, learning_resources, tech_trends, market_insights)):
+            if len(self._research_cache) >= _MAX_CACHED_RESEARCH:
+                del self._research_cache[next(iter(self._research_cache))]
+            self._research_cache[cache_key] = (time.monotonic(), copy.deepcopy(research))
+        
+        return research
     
     async def _research_real_job_demand(self, topic: str, experience_level: str) -> Dict[str, Any]:
         """
@@ -216,11 +285,17 @@ class MarketResearchAgent:
             # Get real salary data
             salary_data = await self.serper.research_salary_data(role, topic, experience_level)
             
+            # No salary figures found (no API key, rate limit, empty results): there is
+            # nothing for the LLM to structure, and asking anyway invites invented numbers
+            if not salary_data.get("salary_data"):
+                logger.info(f"No salary figures found for {role}; skipping career path synthesis")
+                return {}
+            
             # Use LLM to structure the data (not fabricate it)
             prompt = f"""
             Based on REAL salary data and job market information:
             
-            {json.dumps(salary_data, indent=2)}
+            {_compact_salary_data(salary_data)}
             
             Create a structured career path for {topic} professionals at {experience_level} level.
             Use ONLY the data provided above. Do not invent salary figures or statistics.
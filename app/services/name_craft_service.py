@@ -5,7 +5,6 @@ from pathlib import Path
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from langsmith import Client
 
 from app.config import settings
 from app.schemas.name_craft import NameCraftRequest, NameCraftResponse
@@ -21,13 +20,6 @@ class NameCraftService:
             os.environ["LANGCHAIN_API_KEY"] = settings.LANGCHAIN_API_KEY or ""
             os.environ["LANGCHAIN_PROJECT"] = settings.LANGCHAIN_PROJECT or "faltuai-fun"
 
-        self.langsmith_client = None
-        try:
-            self.langsmith_client = Client()
-            logger.info("LangSmith client initialized for NameCraftService")
-        except Exception as exc:
-            logger.warning(f"LangSmith client initialization failed: {exc}")
-
         self.llm = ChatOpenAI(
             openai_api_key=settings.OPENAI_API_KEY,
             model=settings.OPENAI_MODEL,
@@ -35,6 +27,7 @@ class NameCraftService:
         )
 
         self.prompt_path = Path(__file__).resolve().parents[1] / "prompts" / "name_craft.md"
+        self._chain = None
 
     def _load_system_prompt(self) -> str:
         if not self.prompt_path.exists():
@@ -42,6 +35,39 @@ class NameCraftService:
 
         return self.prompt_path.read_text(encoding="utf-8").strip()
 
+    def _get_chain(self):
+        # Prompt file is read and the prompt/structured-output chain compiled once, on first use
+        if self._chain is None:
+            system_prompt = self._load_system_prompt()
+
+            prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", system_prompt),
+                    (
+                        "human",
+                        (
+                            "Generate naming suggestions with this input:\n"
+                            "Project Name: {project_name}\n"
+                            "Project Type: {project_type}\n"
+                            "Naming Preference: {naming_preference}\n"
+                            "Include Database: {include_database}\n"
+                            "Include Microservices: {include_microservices}\n"
+                            "Include Frontend/Backend Separation: {include_frontend_backend_separation}\n"
+                            "Include Messaging System: {include_messaging_system}\n"
+                            "Include Analytics: {include_analytics}\n"
+                            "Advanced Options Enabled: {advanced_options_enabled}\n"
+                            "Cloud Provider: {cloud_provider}\n"
+                            "Infrastructure Style: {infrastructure_style}\n"
+                            "DevOps Workflow: {devops_workflow}\n"
+                            "Microservices Architecture: {microservices_architecture}"
+                        ),
+                    ),
+                ]
+            )
+
+            self._chain = prompt | self.llm.with_structured_output(NameCraftResponse)
+        return self._chain
+
     @staticmethod
     def _slugify(value: str) -> str:
         lowered = (value or "").strip().lower()
@@ -108,34 +134,7 @@ class NameCraftService:
         if len(normalized_project_name) < 2:
             raise ValueError("Please provide a project name with at least 2 characters.")
 
-        system_prompt = self._load_system_prompt()
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_prompt),
-                (
-                    "human",
-                    (
-                        "Generate naming suggestions with this input:\n"
-                        "Project Name: {project_name}\n"
-                        "Project Type: {project_type}\n"
-                        "Naming Preference: {naming_preference}\n"
-                        "Include Database: {include_database}\n"
-                        "Include Microservices: {include_microservices}\n"
-                        "Include Frontend/Backend Separation: {include_frontend_backend_separation}\n"
-                        "Include Messaging System: {include_messaging_system}\n"
-                        "Include Analytics: {include_analytics}\n"
-                        "Advanced Options Enabled: {advanced_options_enabled}\n"
-                        "Cloud Provider: {cloud_provider}\n"
-                        "Infrastructure Style: {infrastructure_style}\n"
-                        "DevOps Workflow: {devops_workflow}\n"
-                        "Microservices Architecture: {microservices_architecture}"
-                    ),
-                ),
-            ]
-        )
-
-        chain = prompt | self.llm.with_structured_output(NameCraftResponse)
+        chain = self._get_chain()
 
         result = await chain.ainvoke(
             {
@@ -445,4 +445,8 @@ class PDFService:
         story.append(Paragraph(
             f"Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M')} | FaltuAI.fun",
             self.styles['Normal']
-        ))
\ No newline at end of file
+        ))
+
+
+# Global instance
+pdf_service = PDFService()
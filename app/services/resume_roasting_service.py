@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from app.config import settings
 
 # Simple logging
@@ -55,6 +55,9 @@ class ResumeRoastingService:
                 "system_prompt": "You are a career counselor focused on helping people improve their resumes."
             }
         }
+        
+        # Compiled prompt | llm | parser chain per style, built on first use
+        self._chains: Dict[str, Any] = {}
     
     def get_available_styles(self) -> Dict[str, Dict]:
         """Get available roasting styles"""
@@ -69,16 +72,16 @@ class ResumeRoastingService:
         if style not in self.roast_styles:
             style = "funny"
         
-        style_config = self.roast_styles[style]
-        
-        # Create simple prompt
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", style_config["system_prompt"]),
-            ("human", "Please review this resume: {resume_text}")
-        ])
-        
-        # Simple chain
-        chain = prompt | self.llm | StrOutputParser()
+        chain = self._chains.get(style)
+        if chain is None:
+            # Create simple prompt
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", self.roast_styles[style]["system_prompt"]),
+                ("human", "Please review this resume: {resume_text}")
+            ])
+            
+            # Simple chain
+            chain = self._chains[style] = prompt | self.llm | StrOutputParser()
         
         # Execute - LangSmith will automatically trace if enabled
         logger.info("Executing LangChain...")
@@ -4,6 +4,12 @@ Date utilities for generating current time-aware prompts and content
 from datetime import datetime
 from typing import Tuple
 
+# Northern Hemisphere season for each month, indexed by month - 1
+_SEASONS: Tuple[str, ...] = (
+    "Winter", "Winter", "Spring", "Spring", "Spring", "Summer",
+    "Summer", "Summer", "Fall", "Fall", "Fall", "Winter"
+)
+
 def get_current_period() -> dict:
     """
     Get current time period information for use in prompts and content generation.
@@ -26,14 +32,7 @@ def get_current_period() -> dict:
     quarter = f"Q{(month - 1) // 3 + 1}"
     
     # Determine season (Northern Hemisphere)
-    if month in [12, 1, 2]:
-        season = "Winter"
-    elif month in [3, 4, 5]:
-        season = "Spring"
-    elif month in [6, 7, 8]:
-        season = "Summer"
-    else:
-        season = "Fall"
+    season = _SEASONS[month - 1]
     
     return {
         "year": year,
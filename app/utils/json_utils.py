@@ -0,0 +1,12 @@
+"""
+JSON utilities shared by the LLM service and the data source agents
+"""
+import json
+
+try:
+    import orjson
+    # orjson parses the KB-sized structured responses 2-3x faster; it accepts str
+    # and raises a json.JSONDecodeError subclass, so callers are unaffected
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
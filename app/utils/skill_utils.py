@@ -0,0 +1,43 @@
+"""
+Skill assessment utilities for difficulty mapping and quiz sizing
+"""
+from typing import Dict, FrozenSet
+
+from app.schemas.skill_assessment import DIFFICULTY_ALIASES, DifficultyLevel, ExperienceLevel
+
+_BASE_QUESTION_COUNTS: Dict[str, int] = {
+    ExperienceLevel.BEGINNER.value: 8,
+    ExperienceLevel.INTERMEDIATE.value: 12,
+    ExperienceLevel.ADVANCED.value: 15
+}
+
+# Topic complexity multipliers
+_COMPLEX_TOPICS: FrozenSet[str] = frozenset({'ai-ml', 'devops', 'cybersecurity', 'data-engineering', 'backend'})
+_SIMPLE_TOPICS: FrozenSet[str] = frozenset({'frontend', 'mobile'})
+
+
+def map_to_difficulty_level(difficulty_str: str) -> DifficultyLevel:
+    """Map various difficulty strings to valid DifficultyLevel enum values"""
+    # LLM output is almost always already lowercase; only normalize on a miss
+    level = DIFFICULTY_ALIASES.get(difficulty_str)
+    if level is None:
+        level = DIFFICULTY_ALIASES.get(difficulty_str.lower(), DifficultyLevel.MEDIUM)
+    return level
+
+
+def calculate_optimal_question_count(topic: str, experience_level_str: str) -> int:
+    """Calculate optimal number of questions based on topic complexity and experience level"""
+    questions_count = _BASE_QUESTION_COUNTS[experience_level_str]
+
+    topic_key = topic.lower()
+    if topic_key in _COMPLEX_TOPICS:
+        questions_count += 2
+    elif topic_key in _SIMPLE_TOPICS:
+        questions_count -= 1
+
+    # Ensure between 6-20 questions
+    if questions_count < 6:
+        return 6
+    if questions_count > 20:
+        return 20
+    return questions_count